@@ -28,10 +28,12 @@ import tempfile
 import unittest
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import patch
 
 import pytest
 import yaml
 
+from FactoryMode.TestFiles.test_mocks import MockFactoryFlowOrchestrator
 from FactoryMode.TrayFlowFunctions.compute_factory_flow_functions import ComputeFactoryFlowConfig
 from FactoryMode.TrayFlowFunctions.config_utils import ConfigLoader
 from FactoryMode.TrayFlowFunctions.power_shelf_factory_flow_functions import (
@@ -505,6 +507,29 @@ class TestConfigurationIntegration(unittest.TestCase):
             self.assertEqual(cfg.get_config("variables"), {})
             self.assertEqual(cfg.get_config("connection"), {})
 
+    def test_preloaded_config_skips_file_load(self):
+        """Test that an already parsed config is used instead of re-reading the file."""
+        shared_config = {
+            "settings": {"default_retry_count": 2},
+            "compute": {"DOT": "Volatile"},
+            "switch": {"platform": "NVSwitch"},
+            "power_shelf": {"psu_count": 4},
+        }
+
+        config_path = Path(self.test_dir) / "preloaded_config.yaml"
+        with open(config_path, "w") as f:
+            yaml.dump(shared_config, f)
+
+        with patch.object(ConfigLoader, "load_config") as mock_load:
+            compute_cfg = ComputeFactoryFlowConfig(str(config_path), preloaded=shared_config)
+            switch_cfg = SwitchFactoryFlowConfig(str(config_path), preloaded=shared_config)
+            shelf_cfg = PowerShelfFactoryFlowConfig(str(config_path), preloaded=shared_config)
+
+        mock_load.assert_not_called()
+        self.assertEqual(compute_cfg.get_config("compute")["DOT"], "Volatile")
+        self.assertEqual(switch_cfg.get_config("switch")["platform"], "NVSwitch")
+        self.assertEqual(shelf_cfg.get_config("power_shelf")["psu_count"], 4)
+
     def test_config_concurrent_access(self):
         """Test concurrent access to configuration files."""
         import threading
@@ -556,6 +581,64 @@ class TestConfigurationIntegration(unittest.TestCase):
         self.assertEqual(len(results), 50)  # 5 workers * 10 iterations each
 
 
+class TestOrchestratorConfigCache(unittest.TestCase):
+    """Test that the orchestrator parses the main config once and shares it in memory."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_path = str(Path(self.test_dir) / "factory_flow_config.yaml")
+        self.orchestrators = []
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+
+        for orchestrator in self.orchestrators:
+            orchestrator.cleanup()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write_config_file(self, config_data: Dict[str, Any]):
+        """Write config data to the test config file."""
+        with open(self.config_path, "w") as f:
+            yaml.dump(config_data, f)
+
+    def _create_orchestrator(self):
+        """Create an orchestrator for the test config with a temporary log directory."""
+        orchestrator = MockFactoryFlowOrchestrator(self.config_path, test_name="config_cache")
+        self.orchestrators.append(orchestrator)
+        return orchestrator
+
+    def test_config_parsed_once_and_shared(self):
+        """Test that variables, retry defaults and device configs share one parse."""
+        self._write_config_file(
+            {
+                "settings": {"default_retry_count": 4},
+                "variables": {"output_mode": "none"},
+                "compute": {"DOT": "Volatile"},
+            }
+        )
+
+        with patch("FactoryMode.factory_flow_orchestrator._fast_yaml_load", side_effect=yaml.safe_load) as mock_load:
+            orchestrator = self._create_orchestrator()
+            self.assertEqual(orchestrator._get_default_retry_count(), 4)
+            self.assertEqual(orchestrator.compute_config.get_config("compute")["DOT"], "Volatile")
+            self.assertIsNotNone(orchestrator.switch_config)
+            self.assertIsNotNone(orchestrator.power_shelf_config)
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(os.listdir(self.test_dir), ["factory_flow_config.yaml"])
+
+    def test_changed_config_is_reparsed(self):
+        """Test that a changed config file replaces the in-memory parse."""
+        self._write_config_file({"variables": {"output_mode": "none", "value": "first"}})
+        orchestrator = self._create_orchestrator()
+        self.assertEqual(orchestrator._get_raw_config()["variables"]["value"], "first")
+
+        self._write_config_file({"variables": {"output_mode": "none", "value": "second, longer"}})
+        self.assertEqual(orchestrator._get_raw_config()["variables"]["value"], "second, longer")
+
+
 class TestStrictConfigValidation(unittest.TestCase):
     """Test strict validation of configuration files for type mismatches and invalid values."""
 
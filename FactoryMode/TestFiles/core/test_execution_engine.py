@@ -597,6 +597,103 @@ class TestParallelExecution(unittest.TestCase):
         self.assertTrue(compute_executed)
         self.assertTrue(switch_executed)
 
+    def test_parallel_steps_reuse_shared_pool_and_respect_max_workers(self):
+        """Test that parallel groups share one pool, honor max_workers and release it on close."""
+        import threading
+
+        orchestrator = self.orchestrator._orchestrator
+        state = {"active": 0, "peak": 0}
+        state_lock = threading.Lock()
+
+        def tracked_step(step):
+            with state_lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with state_lock:
+                state["active"] -= 1
+            return True
+
+        steps = [
+            FlowStep(name=f"Step{i}", device_type=DeviceType.COMPUTE, device_id="compute1", operation="test_operation")
+            for i in range(4)
+        ]
+        with patch.object(orchestrator, "execute_step", side_effect=tracked_step):
+            self.assertTrue(orchestrator.execute_parallel_steps(ParallelFlowStep(steps=steps, max_workers=1)))
+            pool = orchestrator._pool
+            self.assertIsNotNone(pool)
+            self.assertEqual(state["peak"], 1)
+
+            self.assertTrue(orchestrator.execute_parallel_steps(ParallelFlowStep(steps=steps, max_workers=4)))
+            self.assertIs(orchestrator._pool, pool)
+
+        orchestrator.close()
+        self.assertIsNone(orchestrator._pool)
+
+    def test_parallel_steps_in_parallel_flows_use_dedicated_executor(self):
+        """Test that parallel groups inside concurrently running flows do not share the pool."""
+        orchestrator = self.orchestrator._orchestrator
+        flows = [
+            IndependentFlow(
+                name=f"Flow{i}",
+                steps=[
+                    ParallelFlowStep(
+                        steps=[
+                            FlowStep(
+                                name=f"Step{i}{j}",
+                                device_type=DeviceType.COMPUTE,
+                                device_id="compute1",
+                                operation="test_operation",
+                            )
+                            for j in range(2)
+                        ]
+                    )
+                ],
+            )
+            for i in range(2)
+        ]
+
+        self.assertTrue(orchestrator.execute_parallel_flows(flows))
+        self.assertIsNone(orchestrator._pool)
+
+        self.assertTrue(orchestrator.execute_parallel_steps(flows[0].steps[0]))
+        self.assertIsNotNone(orchestrator._pool)
+
+    def test_parallel_steps_fail_fast_skips_unstarted_steps(self):
+        """Test that steps not yet started are skipped once a parallel step fails."""
+        orchestrator = self.orchestrator._orchestrator
+        executed = []
+
+        def recording_step(step):
+            executed.append(step.name)
+            return step.name != "First"
+
+        steps = [
+            FlowStep(name=name, device_type=DeviceType.COMPUTE, device_id="compute1", operation="test_operation")
+            for name in ("First", "Second", "Third")
+        ]
+        with patch.object(orchestrator, "execute_step", side_effect=recording_step):
+            self.assertFalse(orchestrator.execute_parallel_steps(ParallelFlowStep(steps=steps, max_workers=1)))
+
+        self.assertEqual(executed, ["First"])
+
+    def test_parallel_steps_small_and_large_groups_report_failures(self):
+        """Test that both the ordered join and the wait-based join report a failed step."""
+        orchestrator = self.orchestrator._orchestrator
+        for group_size in (3, 8):
+            steps = [
+                FlowStep(
+                    name=f"Step{i}",
+                    device_type=DeviceType.COMPUTE,
+                    device_id="compute1",
+                    operation="fail_test" if i == group_size - 1 else "pass_test",
+                )
+                for i in range(group_size)
+            ]
+            with self.subTest(group_size=group_size):
+                self.assertFalse(orchestrator.execute_parallel_steps(ParallelFlowStep(steps=steps)))
+                self.assertTrue(orchestrator.execute_parallel_steps(ParallelFlowStep(steps=steps[:-1])))
+
     def test_parallel_steps_different_thread_execution(self):
         """Test that parallel steps actually execute in different threads."""
         parallel_step = ParallelFlowStep(
@@ -1206,6 +1303,29 @@ class TestExecutionEngineEdgeCases(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.orchestrator._get_device_flow("invalid", "x")
 
+    def test_real_get_device_flow_last_used_cache(self):
+        from FactoryMode.factory_flow_orchestrator import FactoryFlowOrchestrator
+        from FactoryMode.TestFiles.test_mocks import MockFlow
+
+        orchestrator = self.orchestrator._orchestrator
+        for device_type, (flows, _factory) in list(orchestrator._device_dispatch.items()):
+            orchestrator._device_dispatch[device_type] = (flows, MockFlow)
+
+        def get_flow(device_type, device_id):
+            return FactoryFlowOrchestrator._get_device_flow(orchestrator, device_type, device_id)
+
+        c1 = get_flow(DeviceType.COMPUTE, "compute1")
+        self.assertIs(get_flow(DeviceType.COMPUTE, "compute1"), c1)
+        c2 = get_flow(DeviceType.COMPUTE, "compute2")
+        self.assertIsNot(c2, c1)
+        s1 = get_flow(DeviceType.SWITCH, "compute1")
+        self.assertIsNot(s1, c1)
+        self.assertIs(get_flow(DeviceType.COMPUTE, "compute1"), c1)
+        self.assertIs(orchestrator.switch_flows["compute1"], s1)
+
+        with self.assertRaises(ValueError):
+            get_flow(None, None)
+
     def test_execute_step_success_path(self):
         step = FlowStep(
             name="Op",
@@ -1216,6 +1336,30 @@ class TestExecutionEngineEdgeCases(unittest.TestCase):
         ok = self.orchestrator.execute_step(step)
         self.assertTrue(ok)
 
+    def test_execute_step_reuses_bound_operation_and_honors_overrides(self):
+        step = FlowStep(
+            name="Op",
+            device_type=DeviceType.COMPUTE,
+            device_id="compute1",
+            operation="pass_test",
+        )
+        self.assertTrue(self.orchestrator.execute_step(step))
+        cached = self.orchestrator._op_cache[(DeviceType.COMPUTE, "compute1", "pass_test")]
+        self.assertIs(cached.__self__, self.mock_compute_flow)
+
+        # Instance-level overrides must win over the cached bound method
+        with patch.object(self.mock_compute_flow, "pass_test", return_value=False):
+            self.assertFalse(self.orchestrator.execute_step(step))
+        self.assertTrue(self.orchestrator.execute_step(step))
+
+    def test_execute_step_rejects_unknown_and_private_operations(self):
+        orchestrator = self.orchestrator._orchestrator
+        for operation in ("no_such_operation", "__init__"):
+            step = FlowStep(name="Op", device_type=DeviceType.COMPUTE, device_id="compute1", operation=operation)
+            self.assertFalse(orchestrator.execute_step(step))
+            self.assertIsInstance(step.last_exception, ValueError)
+            self.assertIn(f"Unsupported operation '{operation}'", str(step.last_exception))
+
     def test_execute_parallel_steps_exception_branch(self):
         parallel = ParallelFlowStep(
             name="P",
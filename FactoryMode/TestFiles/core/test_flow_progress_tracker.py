@@ -23,6 +23,7 @@ python3 -m unittest TestFiles.test_flow_progress_tracker -v
 """
 
 import json
+import sys
 import tempfile
 import threading
 import time
@@ -32,7 +33,7 @@ from pathlib import Path
 import pytest
 
 from FactoryMode.flow_progress_tracker import FlowProgressTracker, StepExecution
-from FactoryMode.flow_types import DeviceType, FlowStep
+from FactoryMode.flow_types import DeviceType, FlowStep, FrozenParameters
 
 # Mark all tests in this file as core tests
 pytestmark = pytest.mark.core
@@ -204,6 +205,61 @@ class TestStepExecution(unittest.TestCase):
         self.assertIsInstance(step1.execution_id, str)
         self.assertIsInstance(step2.execution_id, str)
 
+    def test_step_execution_from_dict_round_trip_and_defaults(self):
+        """Test that from_dict restores stored fields and fills fresh defaults for missing ones."""
+        from unittest.mock import patch
+
+        step = StepExecution(
+            step_name="Step 1",
+            step_operation="op1",
+            device_type="compute",
+            device_id="compute1",
+            step_index=0,
+            started_at=self.start_time,
+            flow_name="Test Flow",
+            retry_attempts=2,
+            retry_durations=[1.0, 2.0],
+            jump_taken="failure",
+        )
+        data = dict(step.to_dict(), flow_name="Test Flow")
+
+        with patch("FactoryMode.flow_progress_tracker.uuid.uuid4") as mock_uuid:
+            restored = StepExecution.from_dict(data)
+        mock_uuid.assert_not_called()
+        self.assertEqual(restored, step)
+
+        required = {k: data[k] for k in ("step_name", "step_operation", "device_type", "device_id", "step_index")}
+        minimal = dict(required, started_at=self.start_time, flow_name="Test Flow")
+        first = StepExecution.from_dict(minimal)
+        second = StepExecution.from_dict(minimal)
+        self.assertEqual(first.retry_count, 3)
+        self.assertEqual(first.status, "running")
+        self.assertEqual(first.retry_durations, [])
+        self.assertIsNot(first.retry_durations, second.retry_durations)
+        self.assertNotEqual(first.execution_id, second.execution_id)
+
+        self.assertEqual(StepExecution.from_dict(dict(data, legacy_key=1)), step)
+        with self.assertRaises(KeyError):
+            StepExecution.from_dict({k: v for k, v in data.items() if k != "step_name"})
+
+    def test_step_execution_error_message_field(self):
+        """Test that error_message is a declared field kept out of the JSON record."""
+        step = StepExecution(
+            step_name="Step 1",
+            step_operation="op1",
+            device_type="compute",
+            device_id="compute1",
+            step_index=0,
+            started_at=self.start_time,
+            flow_name="Test Flow",
+        )
+
+        self.assertIsNone(step.error_message)
+        step.error_message = "failed"
+        self.assertNotIn("error_message", step.to_dict())
+        if sys.version_info >= (3, 10):
+            self.assertFalse(hasattr(step, "__dict__"))
+
 
 class TestFlowProgressTracker(unittest.TestCase):
     """Test cases for FlowProgressTracker class."""
@@ -1236,6 +1292,374 @@ class TestFlowProgressTracker(unittest.TestCase):
         self.assertIn("Step 'S1' failed:", flow_info.current_step)
         self.assertEqual(flow_info.error_messages, ["BMC connection timeout", "Retry exceeded"])
 
+    def test_get_flow_info_cache_invalidated_on_re_add_and_clear(self):
+        """Test that the cached last flow lookup never returns a replaced or cleared flow."""
+        self.tracker.add_flow(flow_name="Cached Flow", total_steps=1)
+        first = self.tracker.get_flow_info("Cached Flow")
+        self.assertIs(self.tracker.get_flow_info("Cached Flow"), first)
+
+        self.tracker.add_flow(flow_name="Cached Flow", total_steps=3)
+        second = self.tracker.get_flow_info("Cached Flow")
+        self.assertIsNot(second, first)
+        self.assertEqual(second.total_steps, 3)
+
+        self.tracker.clear()
+        self.assertIsNone(self.tracker.get_flow_info("Cached Flow"))
+
+    def test_step_updates_are_batched_into_deferred_json_write(self):
+        """Test that step-level updates share one deferred write and flush() persists them."""
+        from unittest.mock import patch
+
+        flow_name = "Batched Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=3)
+        self.tracker.JSON_FLUSH_INTERVAL_SECONDS = 60
+
+        with patch.object(self.tracker, "_write_json", wraps=self.tracker._write_json) as mock_write:
+            for i in range(3):
+                step = FlowStep(
+                    device_type=DeviceType.COMPUTE,
+                    device_id="compute1",
+                    operation="op",
+                    parameters={},
+                    name=f"Step {i}",
+                )
+                execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=i)
+                self.tracker.complete_step_execution(execution_id, result=True)
+                self.tracker.update_flow_current_step(flow_name, f"Step {i}", i + 1)
+                self.tracker.increment_retries(flow_name)
+
+            mock_write.assert_not_called()
+            self.tracker.flush()
+            self.assertEqual(mock_write.call_count, 1)
+
+        with open(self.json_path) as f:
+            saved_flow = json.load(f)["flows"][flow_name]
+        self.assertEqual(len(saved_flow["steps_executed"]), 3)
+        self.assertEqual(saved_flow["retries_executed"], 3)
+        self.assertIsNone(self.tracker._json_flush_timer)
+
+    def test_incremental_statistics_match_full_recalculation(self):
+        """Test that per-step statistics updates agree with recalculating from all steps."""
+        flow_name = "Stats Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=4)
+        outcomes = [(True, 0, None), (False, 2, "failure"), (True, 2, None), (True, 1, "success")]
+
+        for index, (result, retries, jump) in enumerate(outcomes):
+            step = FlowStep(
+                device_type=DeviceType.COMPUTE,
+                device_id="compute1",
+                operation="op",
+                parameters={},
+                name=f"Step {index}",
+            )
+            execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=index)
+            for attempt in range(1, retries + 1):
+                self.tracker.add_step_retry(execution_id, attempt=attempt, duration=0.01)
+            if jump:
+                self.tracker.add_step_jump(execution_id, jump, "target")
+            self.tracker.add_optional_flow_trigger(execution_id, f"opt_{index}", True)
+            self.tracker.complete_step_execution(execution_id, result=result)
+
+        stat_fields = (
+            "total_step_duration",
+            "total_retry_attempts",
+            "total_optional_flows_triggered",
+            "total_jumps_taken",
+            "failed_steps_count",
+            "average_step_duration",
+            "longest_step_duration",
+            "step_with_most_retries",
+        )
+        flow = self.tracker.flows[flow_name]
+        incremental = {name: getattr(flow, name) for name in stat_fields}
+        self.tracker._calculate_flow_statistics(flow_name)
+        self.assertEqual(incremental, {name: getattr(flow, name) for name in stat_fields})
+        self.assertEqual(flow.step_with_most_retries, "Step 1")
+        self.assertEqual(flow.failed_steps_count, 1)
+        self.assertEqual(flow.total_jumps_taken, 2)
+
+    def test_statistics_recalculated_after_external_step_append(self):
+        """Test that steps appended outside the tracker are still counted in the statistics."""
+        flow_name = "External Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=2)
+        external = StepExecution(
+            step_name="External",
+            step_operation="op",
+            device_type="compute",
+            device_id="compute1",
+            step_index=0,
+            started_at=0.0,
+            flow_name=flow_name,
+            duration=5.0,
+            retry_attempts=3,
+        )
+        self.tracker.flows[flow_name].steps_executed.append(external)
+
+        step = FlowStep(device_type=DeviceType.COMPUTE, device_id="compute1", operation="op", parameters={}, name="S")
+        execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=1)
+        self.tracker.complete_step_execution(execution_id, result=True)
+
+        flow = self.tracker.flows[flow_name]
+        self.assertEqual(flow.total_retry_attempts, 3)
+        self.assertEqual(flow.longest_step_duration, 5.0)
+        self.assertEqual(flow.step_with_most_retries, "External")
+
+    def test_optional_flow_timestamps_written_as_iso(self):
+        """Test that optional flow start and end times are written as ISO strings."""
+        from datetime import datetime
+
+        self.tracker.add_flow(flow_name="main", total_steps=1)
+        self.tracker.add_flow(flow_name="opt", total_steps=1, parent_flow_name="main", triggered_by_step="s")
+        self.tracker.start_flow_timing("opt")
+        self.tracker.complete_flow_timing("opt")
+        opt_flow = self.tracker.flows["opt"]
+
+        with open(self.json_path) as f:
+            saved = json.load(f)["flows"]["main"]["optional_flows"]["opt"]
+        self.assertEqual(saved["started_at"], datetime.fromtimestamp(opt_flow.started_at).isoformat())
+        self.assertEqual(saved["completed_at"], datetime.fromtimestamp(opt_flow.completed_at).isoformat())
+
+    def test_get_all_flows_returns_shallow_copies(self):
+        """Test that get_all_flows copies flow containers but keeps StepExecution records."""
+        flow_name = "Snapshot Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=1)
+        step = FlowStep(device_type=DeviceType.COMPUTE, device_id="compute1", operation="op", parameters={}, name="S")
+        execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=0)
+        self.tracker.complete_step_execution(execution_id, result=True)
+
+        snapshot = self.tracker.get_all_flows()[flow_name]
+        original = self.tracker.flows[flow_name]
+        self.assertIsNot(snapshot, original)
+        self.assertIsNot(snapshot.steps_executed, original.steps_executed)
+        self.assertIs(snapshot.steps_executed[0], original.steps_executed[0])
+        self.assertIsInstance(snapshot.steps_executed[0], StepExecution)
+
+        snapshot.steps_executed.clear()
+        self.assertEqual(len(original.steps_executed), 1)
+
+    def test_step_parameters_shared_when_read_only(self):
+        """Test that read-only step parameters are recorded without a copy and others are copied."""
+        flow_name = "Params Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=2)
+        frozen = FrozenParameters({"bundle": "fw.bin"})
+        plain = {"bundle": "fw.bin"}
+
+        frozen_step = FlowStep(device_type=DeviceType.COMPUTE, device_id="c1", operation="op", parameters=frozen)
+        plain_step = FlowStep(device_type=DeviceType.COMPUTE, device_id="c1", operation="op", parameters=plain)
+        frozen_id = self.tracker.start_step_execution(flow_name=flow_name, step=frozen_step, step_index=0)
+        plain_id = self.tracker.start_step_execution(flow_name=flow_name, step=plain_step, step_index=1)
+
+        self.assertIs(self.tracker._active_step_executions[frozen_id].parameters, frozen)
+        recorded = self.tracker._active_step_executions[plain_id].parameters
+        self.assertIsNot(recorded, plain)
+        self.assertEqual(recorded, plain)
+
+        empty_steps = [
+            FlowStep(device_type=DeviceType.COMPUTE, device_id="c1", operation="op", parameters={}),
+            FlowStep(device_type=DeviceType.COMPUTE, device_id="c1", operation="op", parameters=None),
+        ]
+        empty_records = [
+            self.tracker._active_step_executions[
+                self.tracker.start_step_execution(flow_name=flow_name, step=empty_step, step_index=0)
+            ].parameters
+            for empty_step in empty_steps
+        ]
+        self.assertEqual(empty_records[0], {})
+        self.assertIs(empty_records[0], empty_records[1])
+        with self.assertRaises(TypeError):
+            empty_records[0]["key"] = "value"
+
+    def test_unchanged_progress_not_rewritten(self):
+        """Test that a write with no flow changes leaves the file alone unless it is missing or stale."""
+        self.tracker.add_flow(flow_name="Idle Flow", total_steps=1)
+        with open(self.json_path) as f:
+            first_timestamp = json.load(f)["timestamp"]
+
+        time.sleep(0.01)
+        self.tracker._write_json()
+        with open(self.json_path) as f:
+            self.assertEqual(json.load(f)["timestamp"], first_timestamp)
+
+        self.tracker.set_flow_running("Idle Flow")
+        with open(self.json_path) as f:
+            saved = json.load(f)
+        self.assertNotEqual(saved["timestamp"], first_timestamp)
+        self.assertEqual(saved["flows"]["Idle Flow"]["status"], "Running")
+
+        self.json_path.unlink()
+        self.tracker._write_json()
+        self.assertTrue(self.json_path.exists())
+
+        # Past the heartbeat interval an unchanged snapshot is rewritten with a fresh timestamp
+        with open(self.json_path) as f:
+            previous_timestamp = json.load(f)["timestamp"]
+        time.sleep(0.01)
+        self.tracker.JSON_HEARTBEAT_INTERVAL_SECONDS = 0
+        self.tracker._write_json()
+        with open(self.json_path) as f:
+            self.assertNotEqual(json.load(f)["timestamp"], previous_timestamp)
+
+    def test_step_completed_callback_runs_outside_step_lock(self):
+        """Test that other threads can start steps while the step-completed callback runs."""
+        from unittest.mock import MagicMock
+
+        flow_name = "Callback Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=2)
+        step = FlowStep(device_type=DeviceType.COMPUTE, device_id="compute1", operation="op", parameters={}, name="S")
+        started_from_callback = []
+
+        def on_step_completed(*_args):
+            worker = threading.Thread(
+                target=lambda: started_from_callback.append(
+                    self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=1)
+                )
+            )
+            worker.start()
+            worker.join(timeout=5)
+
+        self.tracker.output_manager = MagicMock()
+        self.tracker.output_manager.on_step_completed.side_effect = on_step_completed
+
+        execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=0)
+        self.tracker.complete_step_execution(execution_id, result=True)
+
+        self.assertEqual(len(started_from_callback), 1)
+        self.assertIn(started_from_callback[0], self.tracker._active_step_executions)
+        self.assertNotIn(execution_id, self.tracker._active_step_executions)
+
+    def test_start_step_execution_flow_step_and_step_like_objects(self):
+        """Test that FlowStep and other step-like objects record the same configuration."""
+        from types import SimpleNamespace
+
+        flow_name = "Fields Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=3)
+        flow_step = FlowStep(
+            device_type=DeviceType.SWITCH,
+            device_id="switch1",
+            operation="op",
+            retry_count=5,
+            timeout_seconds=30,
+            jump_on_failure="recover",
+            tag="start",
+        )
+        step_like = SimpleNamespace(**{name: getattr(flow_step, name) for name in flow_step.__dataclass_fields__})
+        bare = SimpleNamespace()
+
+        recorded = [
+            self.tracker._active_step_executions[
+                self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=2)
+            ].to_dict()
+            for step in (flow_step, step_like, bare)
+        ]
+
+        for record in recorded:
+            record.pop("execution_id")
+            record.pop("started_at")
+        self.assertEqual(recorded[0], recorded[1])
+        self.assertEqual(recorded[0]["step_name"], "op")
+        self.assertEqual(recorded[0]["device_type"], "switch")
+        self.assertEqual(recorded[0]["retry_count"], 5)
+        self.assertEqual(recorded[2]["step_name"], "Step 3")
+        self.assertEqual(recorded[2]["step_operation"], "unknown")
+        self.assertEqual(recorded[2]["device_type"], "unknown")
+
+    def test_device_type_name_conversion(self):
+        """Test device type strings for enum members, plain values and unhashable values."""
+        from enum import Enum
+
+        from FactoryMode.flow_progress_tracker import _device_type_name
+
+        class OtherType(Enum):
+            TRAY = "tray"
+
+        for device_type in DeviceType:
+            self.assertEqual(_device_type_name(device_type), device_type.value)
+        self.assertEqual(_device_type_name(OtherType.TRAY), "tray")
+        self.assertEqual(_device_type_name("compute"), "compute")
+        self.assertEqual(_device_type_name(None), "None")
+        self.assertEqual(_device_type_name(["compute"]), "['compute']")
+
+    def test_find_step_execution_index_tracks_flow_changes(self):
+        """Test executed-step lookups across appends, external edits and re-added flows."""
+        flow_name = "Lookup Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=3)
+        step = FlowStep(device_type=DeviceType.COMPUTE, device_id="compute1", operation="op", parameters={}, name="S")
+
+        execution_ids = []
+        for index in range(3):
+            execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=index)
+            self.assertIsNone(self.tracker.find_step_execution(flow_name, execution_id))
+            self.assertFalse(self.tracker.is_step_execution_complete(execution_id))
+            self.tracker.complete_step_execution(execution_id, result=index != 1)
+            execution_ids.append(execution_id)
+
+        for index, execution_id in enumerate(execution_ids):
+            found = self.tracker.find_step_execution(flow_name, execution_id)
+            self.assertIs(found, self.tracker.flows[flow_name].steps_executed[index])
+            self.assertTrue(self.tracker.is_step_execution_complete(execution_id))
+        self.assertIsNone(self.tracker.find_step_execution("Other Flow", execution_ids[0]))
+
+        # Steps appended or moved outside complete_step_execution are still found
+        steps = self.tracker.flows[flow_name].steps_executed
+        external = StepExecution(
+            step_name="External",
+            step_operation="op",
+            device_type="compute",
+            device_id="compute1",
+            step_index=3,
+            started_at=0.0,
+            flow_name=flow_name,
+            status="completed",
+        )
+        steps.append(external)
+        self.assertIs(self.tracker.find_step_execution(flow_name, external.execution_id), external)
+        steps[0], steps[1] = steps[1], steps[0]
+        self.assertIs(self.tracker.find_step_execution(flow_name, execution_ids[0]), steps[1])
+
+        # A re-added flow starts with no executed steps
+        self.tracker.add_flow(flow_name=flow_name, total_steps=3)
+        self.assertIsNone(self.tracker.find_step_execution(flow_name, execution_ids[0]))
+        self.assertFalse(self.tracker.is_step_execution_complete(execution_ids[0]))
+
+    def test_step_duration_unaffected_by_wall_clock_jump(self):
+        """Test that step duration comes from the monotonic clock, not wall-clock timestamps."""
+        from unittest.mock import patch
+
+        flow_name = "Clock Flow"
+        self.tracker.add_flow(flow_name=flow_name, total_steps=1)
+        step = FlowStep(device_type=DeviceType.COMPUTE, device_id="compute1", operation="op", parameters={}, name="S")
+        wall_clock = [1_000_000.0]
+
+        with patch("FactoryMode.flow_progress_tracker.time.time", side_effect=lambda: wall_clock[0]):
+            execution_id = self.tracker.start_step_execution(flow_name=flow_name, step=step, step_index=0)
+            wall_clock[0] -= 3600.0  # clock stepped back an hour mid-step
+            time.sleep(0.01)
+            self.tracker.complete_step_execution(execution_id, result=True)
+
+        step_execution = self.tracker.flows[flow_name].steps_executed[0]
+        self.assertEqual(step_execution.completed_at - step_execution.started_at, -3600.0)
+        self.assertGreaterEqual(step_execution.duration, 0.01)
+        self.assertLess(step_execution.duration, 5.0)
+        self.assertNotIn("started_at_ns", step_execution.to_dict())
+
+    def test_json_written_compactly(self):
+        """Test that the progress file is written as compact JSON that round-trips."""
+        self.tracker.add_flow(flow_name="Compact Flow", total_steps=1)
+
+        content = self.json_path.read_text(encoding="utf-8")
+        self.assertNotIn("\n", content)
+        self.assertNotIn(": ", content)
+        self.assertEqual(json.loads(content)["flows"]["Compact Flow"]["total_steps"], 1)
+
+    def test_flush_writes_indented_snapshot(self):
+        """Test that flush() leaves an indented snapshot even when nothing changed."""
+        self.tracker.add_flow(flow_name="Final Flow", total_steps=1)
+        self.tracker.flush()
+
+        content = self.json_path.read_text(encoding="utf-8")
+        self.assertIn('\n  "flows": {', content)
+        self.assertEqual(json.loads(content)["flows"]["Final Flow"]["total_steps"], 1)
+
 
 if __name__ == "__main__":
     # Run the tests
@@ -18,6 +18,7 @@ import logging
 import pytest
 
 from FactoryMode.output_manager import (
+    MAX_COLLECTED_ERRORS,
     AutoErrorCollectorHandler,
     capture_step_errors,
     get_collected_errors,
@@ -65,6 +66,21 @@ class TestLoggingUtils:
         logger.error("after stop")
         assert get_collected_errors() == captured
 
+    def test_auto_error_collector_keeps_most_recent_errors(self):
+        logger = logging.getLogger("compute_factory_flow")
+        logger.setLevel(logging.INFO)
+        setup_logging("compute_factory_flow")
+
+        start_collecting_errors()
+        for i in range(MAX_COLLECTED_ERRORS + 10):
+            logger.error("noisy error %d", i)
+        captured = stop_collecting_errors()
+
+        assert isinstance(captured, list)
+        assert len(captured) == MAX_COLLECTED_ERRORS
+        assert captured[0] == "noisy error 10"
+        assert captured[-1] == f"noisy error {MAX_COLLECTED_ERRORS + 9}"
+
     def test_setup_logging_file_and_error_handlers(self, tmp_path):
         # Use a custom log directory under tmp_path to avoid cross-test interference
         custom_dir = tmp_path / "logsdir"
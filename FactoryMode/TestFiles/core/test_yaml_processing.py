@@ -28,6 +28,7 @@ python3 -m unittest FactoryMode.TestFiles.test_yaml_processing -v
 """
 
 import os
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -183,6 +184,15 @@ class TestYAMLFlowLoading(unittest.TestCase):
             # Exception is also acceptable behavior
             pass
 
+    def test_invalid_device_type_error_lists_valid_types(self):
+        """Test that unknown and non-string device types raise ValueError naming the valid types."""
+        for device_type in ("invalid_device", ["compute"]):
+            with self.subTest(device_type=device_type):
+                step_config = {"device_type": device_type, "device_id": "device1", "operation": "test_operation"}
+                with self.assertRaises(ValueError) as context:
+                    self.orchestrator._validate_step_fields(step_config, "step[0]")
+                self.assertIn("Must be one of: ['compute', 'switch', 'power_shelf']", str(context.exception))
+
     def test_complex_nested_flows(self):
         """Test loading of complex nested flow structures."""
         # Create a complex YAML with nested structures
@@ -528,6 +538,101 @@ class TestYAMLFlowLoading(unittest.TestCase):
         middle_step = steps[num_steps // 2]
         self.assertEqual(middle_step.name, f"Step {(num_steps // 2) + 1}")
 
+    def test_identical_parameters_shared_between_steps(self):
+        """Test that steps with identical parameters share one read-only mapping."""
+        shared_params = {"timeout": 30, "poll_interval": 5}
+        yaml_content = {
+            "name": "Shared Parameters Flow",
+            "steps": [
+                {
+                    "name": f"Step {i}",
+                    "device_type": "compute",
+                    "device_id": "compute1",
+                    "operation": "test_operation",
+                    "parameters": dict(shared_params),
+                }
+                for i in range(3)
+            ]
+            + [
+                {
+                    "name": "Float Timeout Step",
+                    "device_type": "compute",
+                    "device_id": "compute1",
+                    "operation": "test_operation",
+                    "parameters": {"timeout": 30.0, "poll_interval": 5},
+                },
+                {
+                    "name": "List Parameter Step",
+                    "device_type": "compute",
+                    "device_id": "compute1",
+                    "operation": "test_operation",
+                    "parameters": {"targets": ["a", "b"]},
+                },
+            ],
+        }
+
+        steps = self.orchestrator.load_flow_from_yaml(self._create_yaml_file(yaml_content))
+
+        self.assertIs(steps[0].parameters, steps[1].parameters)
+        self.assertIs(steps[0].parameters, steps[2].parameters)
+        self.assertEqual(steps[0].parameters, shared_params)
+        self.assertIsInstance(steps[0].parameters, dict)
+        # Equal values of different types are not merged
+        self.assertIsNot(steps[3].parameters, steps[0].parameters)
+        self.assertIsInstance(steps[3].parameters["timeout"], float)
+        self.assertEqual(steps[4].parameters, {"targets": ["a", "b"]})
+
+        with self.assertRaises(TypeError):
+            steps[0].parameters["timeout"] = 60
+        params_copy = steps[0].parameters.copy()
+        params_copy["timeout"] = 60
+        self.assertEqual(steps[1].parameters["timeout"], 30)
+
+    def test_parameter_intern_table_reset_per_conversion(self):
+        """Test that direct step conversions do not grow the parameter intern table."""
+        for i in range(5):
+            steps = self.orchestrator._convert_steps_to_flow_objects(
+                [
+                    {
+                        "name": "Step",
+                        "device_type": "compute",
+                        "device_id": "compute1",
+                        "operation": "test_operation",
+                        "parameters": {"run": i},
+                    }
+                ]
+            )
+            self.assertEqual(steps[0].parameters, {"run": i})
+        self.assertEqual(len(self.orchestrator._param_intern), 1)
+
+    def test_step_reference_names_are_interned(self):
+        """Test that tags and jump targets loaded from YAML share one string object."""
+        yaml_content = {
+            "name": "Interned Names Flow",
+            "steps": [
+                {
+                    "name": "Target",
+                    "device_type": "compute",
+                    "device_id": "compute1",
+                    "operation": "test_operation",
+                    "tag": "retry_point",
+                },
+                {
+                    "name": "Jumper",
+                    "device_type": "compute",
+                    "device_id": "compute1",
+                    "operation": "test_operation",
+                    "jump_on_failure": "retry_point",
+                },
+            ],
+        }
+
+        steps = self.orchestrator.load_flow_from_yaml(self._create_yaml_file(yaml_content))
+
+        self.assertEqual(steps[0].tag, "retry_point")
+        self.assertIs(steps[0].tag, steps[1].jump_on_failure)
+        self.assertIsNone(steps[1].tag)
+
     def test_yaml_execution_with_loaded_flow(self):
         """Test that YAML-loaded flows can be executed successfully."""
         # Create an executable YAML flow
@@ -937,6 +1042,107 @@ class TestVariableExpansion(unittest.TestCase):
         self.assertEqual(step.parameters["base_path_0"], "/opt/tools")
         self.assertEqual(step.parameters["combined_0"], "/opt/tools/test_device")
 
+    def test_variable_expansion_in_utf16_flow_file(self):
+        """Test that variables are still expanded when the flow file is UTF-16 encoded."""
+        flow_yaml = {
+            "name": "UTF-16 Flow",
+            "steps": [
+                {
+                    "name": "Wide Step",
+                    "device_type": "compute",
+                    "device_id": "${test_device_id}",
+                    "operation": "variable_test_operation",
+                    "parameters": {"path": "${base_path}"},
+                }
+            ],
+        }
+        file_path = Path(self.test_dir) / "utf16_flow.yaml"
+        with open(file_path, "w", encoding="utf-16") as f:
+            yaml.dump(flow_yaml, f, default_flow_style=False)
+
+        steps = self.orchestrator.load_flow_from_yaml(str(file_path))
+
+        self.assertEqual(steps[0].device_id, "test_device")
+        self.assertEqual(steps[0].parameters["path"], "/opt/tools")
+
+    def test_variable_expansion_skipped_without_references(self):
+        """Test that flows without any ${...} references skip the expansion pass."""
+        plain_yaml = {
+            "name": "Plain Flow",
+            "steps": [
+                {
+                    "name": "Plain Step",
+                    "device_type": "compute",
+                    "device_id": "compute1",
+                    "operation": "variable_test_operation",
+                    "parameters": {"path": "/opt/tools"},
+                }
+            ],
+        }
+        referencing_yaml = {
+            "name": "Referencing Flow",
+            "steps": [dict(plain_yaml["steps"][0], parameters={"path": "${base_path}"})],
+        }
+
+        with patch.object(
+            self.orchestrator._orchestrator,
+            "_expand_variables",
+            wraps=self.orchestrator._orchestrator._expand_variables,
+        ) as mock_expand:
+            steps = self.orchestrator.load_flow_from_yaml(self._create_yaml_file(plain_yaml))
+            mock_expand.assert_not_called()
+            self.assertEqual(steps[0].parameters["path"], "/opt/tools")
+
+            steps = self.orchestrator.load_flow_from_yaml(self._create_yaml_file(referencing_yaml))
+            mock_expand.assert_called()
+            self.assertEqual(steps[0].parameters["path"], "/opt/tools")
+
+    def test_repeated_strings_expanded_once_per_pass(self):
+        """Test that identical templated strings are substituted once and reused."""
+        config = {"steps": [{"parameters": {"path": "${base_path}/${test_device_id}"}} for _ in range(50)]}
+
+        with patch.object(
+            self.orchestrator._orchestrator,
+            "_substitute_variable",
+            wraps=self.orchestrator._orchestrator._substitute_variable,
+        ) as mock_substitute:
+            expanded = self.orchestrator._expand_variables(config)
+
+        self.assertEqual(mock_substitute.call_count, 2)
+        self.assertTrue(all(step["parameters"]["path"] == "/opt/tools/test_device" for step in expanded["steps"]))
+
+    def test_plain_strings_skip_substitution(self):
+        """Test that strings without "${" are returned as-is and unterminated references are left alone."""
+        with patch.object(
+            self.orchestrator._orchestrator,
+            "_substitute_variable",
+            wraps=self.orchestrator._orchestrator._substitute_variable,
+        ) as mock_substitute:
+            self.assertEqual(self.orchestrator._expand_variables("compute1"), "compute1")
+            self.assertEqual(self.orchestrator._expand_variables(["$HOME", {"a": "{x}"}]), ["$HOME", {"a": "{x}"}])
+            self.assertEqual(self.orchestrator._expand_variables("${base_path"), "${base_path")
+
+        mock_substitute.assert_not_called()
+
+    def test_deeply_nested_expansion_copies_without_recursion(self):
+        """Test that expansion handles nesting beyond the recursion limit and leaves the input untouched."""
+        depth = sys.getrecursionlimit() + 100
+        config = leaf = {}
+        for _ in range(depth):
+            child = {}
+            leaf["nested"] = [child]
+            leaf = child
+        leaf["path"] = "${base_path}"
+
+        expanded = self.orchestrator._expand_variables(config)
+
+        node = expanded
+        for _ in range(depth):
+            node = node["nested"][0]
+        self.assertEqual(node["path"], "/opt/tools")
+        self.assertEqual(leaf["path"], "${base_path}")
+        self.assertIsNot(expanded, config)
+
     def test_variable_expansion_edge_cases(self):
         """Test variable expansion edge cases using config variables."""
         # Create YAML that tests edge cases with existing config variables
@@ -1948,6 +2154,23 @@ class TestErrorHandlerRegistrationFromYAML(unittest.TestCase):
         names = orch._collect_error_handler_names(flow_config)
         self.assertEqual(names, {"h1", "h2"})
 
+    def test_collect_error_handler_names_at_any_depth(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+        deep_step = {"device_type": "compute", "device_id": "c1", "operation": "op", "execute_on_error": "h_deep"}
+        flow_config = {
+            "settings": {"execute_on_error": "h_flow"},
+            "steps": [
+                {"steps": [{"parallel": [{"independent_flows": [{"steps": [{"steps": [deep_step]}]}]}]}]},
+                {
+                    "parallel": [
+                        {"device_type": "switch", "device_id": "s1", "operation": "op", "execute_on_error": "h_p"}
+                    ]
+                },
+            ],
+        }
+        names = orch._collect_error_handler_names(flow_config)
+        self.assertEqual(names, {"h_flow", "h_deep", "h_p"})
+
     def test_validate_step_fields_empty_required_raises(self):
         orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
         with self.assertRaises(ValueError):
@@ -2012,6 +2235,133 @@ class TestErrorHandlerRegistrationFromYAML(unittest.TestCase):
         with self.assertRaises(ValueError):
             orch._validate_flow_yaml(bad)
 
+    def test_validate_flow_yaml_invalid_jump_lists_sorted_tags(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+        flow_config = {
+            "steps": [
+                {"device_type": "compute", "device_id": "c1", "operation": "op", "tag": tag}
+                for tag in ("zeta", "alpha", "mid")
+            ]
+            + [{"name": "J", "device_type": "compute", "device_id": "c1", "operation": "op", "jump_on_failure": "nope"}]
+        }
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(flow_config)
+        self.assertIn("Invalid jump target 'nope' in step 'J' at main flow[3]", str(context.exception))
+        self.assertIn("Available tags: ['alpha', 'mid', 'zeta']", str(context.exception))
+
+    def test_validate_flow_yaml_looks_up_known_handlers_once(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+        flow_config = {
+            "steps": [
+                {
+                    "device_type": "compute",
+                    "device_id": f"c{i}",
+                    "operation": "op",
+                    "execute_on_error": "default_error_handler",
+                }
+                for i in range(5)
+            ]
+        }
+        with patch(
+            "FactoryMode.factory_flow_orchestrator.error_handlers.get_handler_names", return_value=[]
+        ) as mock_names:
+            orch._validate_flow_yaml(flow_config)
+        mock_names.assert_called_once()
+
+    def test_validate_flow_yaml_handles_deep_nesting(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+        deepest = {"device_type": "compute", "device_id": "c1", "operation": "op", "tag": "deep"}
+        step = deepest
+        for _ in range(sys.getrecursionlimit() + 100):
+            step = {"steps": [step]}
+        flow_config = {
+            "steps": [step, {"device_type": "compute", "device_id": "c1", "operation": "op", "jump_on_success": "deep"}]
+        }
+
+        orch._validate_flow_yaml(flow_config)
+
+        deepest["jump_on_failure"] = "missing"
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(flow_config)
+        self.assertIn("Invalid jump target 'missing'", str(context.exception))
+
+    def test_validate_flow_yaml_optional_flow_cycles(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+
+        def calls(*targets):
+            return [
+                {"device_type": "compute", "device_id": "c1", "operation": "op", "execute_optional_flow": target}
+                for target in targets
+            ]
+
+        cyclic = {"steps": [], "optional_flows": {"a": calls("b"), "b": calls("c"), "c": calls("b"), "d": calls("d")}}
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(cyclic)
+        self.assertIn("Circular optional flow reference detected: b -> c -> b.", str(context.exception))
+
+        cyclic["optional_flows"] = {"d": calls("d")}
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(cyclic)
+        self.assertIn("Circular optional flow reference detected: d -> d.", str(context.exception))
+
+        # References from steps nested inside an optional flow take part in the cycle check too
+        cyclic["optional_flows"] = {"e": [{"parallel": calls("f")}], "f": calls("e")}
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(cyclic)
+        self.assertIn("Circular optional flow reference detected: e -> f -> e.", str(context.exception))
+
+        # A chain of diamonds has exponentially many paths but must still validate quickly
+        layers = 40
+        diamonds = {f"top{i}": calls(f"left{i}", f"right{i}") for i in range(layers)}
+        for i in range(layers):
+            diamonds[f"left{i}"] = calls(f"top{i + 1}") if i + 1 < layers else []
+            diamonds[f"right{i}"] = calls(f"top{i + 1}") if i + 1 < layers else []
+        orch._validate_flow_yaml({"steps": [], "optional_flows": diamonds})
+
+    def test_validate_flow_yaml_jump_chains(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+
+        def tagged(tag, jump_on_failure=None):
+            step = {"device_type": "compute", "device_id": "c1", "operation": "op", "tag": tag}
+            if jump_on_failure:
+                step["jump_on_failure"] = jump_on_failure
+            return step
+
+        # A long acyclic chain is walked once, not once per tag
+        length = 2000
+        chain = [tagged(f"t{i}", f"t{i + 1}" if i + 1 < length else None) for i in range(length)]
+        orch._validate_flow_yaml({"steps": chain})
+
+        cyclic = {"steps": [tagged("a", "b"), tagged("b", "c"), tagged("c", "b")]}
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(cyclic)
+        self.assertIn("Circular jump dependency detected: b -> c -> b.", str(context.exception))
+
+    def test_validate_flow_yaml_reports_nested_locations(self):
+        orch = MockFactoryFlowOrchestrator("FactoryMode/TestFiles/test_config.yaml")._orchestrator
+
+        def step(**extra):
+            return dict({"device_type": "compute", "device_id": "c1", "operation": "op"}, **extra)
+
+        duplicate_tags = {
+            "steps": [
+                step(name="First", tag="T"),
+                {"independent_flows": [{"name": "Flow1", "steps": [{"steps": [step(name="Second", tag="T")]}]}]},
+            ]
+        }
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(duplicate_tags)
+        self.assertIn("First occurrence: First in main flow.", str(context.exception))
+        self.assertIn("Second occurrence: Second in main flow -> Flow1 -> nested steps", str(context.exception))
+
+        bad_reference = {
+            "steps": [step(tag="T")],
+            "optional_flows": {"recover": [{"parallel": [step(name="P"), step(name="Q", jump_on_failure="Z")]}]},
+        }
+        with self.assertRaises(ValueError) as context:
+            orch._validate_flow_yaml(bad_reference)
+        self.assertIn("step 'Q' at optional flow 'recover'[0] -> parallel[1]", str(context.exception))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -57,15 +57,17 @@ class HttpMethod(Enum):
 class ComputeFactoryFlowConfig:
     """Configuration manager for factory flow operations."""
 
-    def __init__(self, config_path: str = "factory_flow_config.yaml"):
+    def __init__(self, config_path: str = "factory_flow_config.yaml", preloaded: Optional[Dict[str, Any]] = None):
         """
         Initialize the configuration manager.
 
         Args:
             config_path (str): Path to the YAML configuration file
+            preloaded (Optional[Dict[str, Any]]): Already parsed contents of config_path, used instead of
+                re-reading the file when provided
         """
         self.config_path = config_path
-        self.config = ConfigLoader.load_config(config_path)
+        self.config = preloaded if preloaded is not None else ConfigLoader.load_config(config_path)
         # Validate configuration
         self._validate_config(self.config)
         self.connection = BaseConnectionManager(self.config, "compute")
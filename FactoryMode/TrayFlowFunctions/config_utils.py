@@ -27,6 +27,9 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+# libyaml-backed safe loader when PyYAML was built with it, pure-Python SafeLoader otherwise
+SAFE_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigLoader:
     """
@@ -55,7 +58,7 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=SAFE_YAML_LOADER)
 
         # Handle empty files
         if config is None:
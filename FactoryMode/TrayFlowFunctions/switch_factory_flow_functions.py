@@ -25,7 +25,7 @@ import shutil
 import socket
 import tempfile
 import time
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import paramiko
 import urllib3
@@ -47,15 +47,17 @@ urllib3.disable_warnings(InsecureRequestWarning)
 class SwitchFactoryFlowConfig:
     """Configuration manager for switch factory flow operations."""
 
-    def __init__(self, config_path: str = "factory_flow_config.yaml"):
+    def __init__(self, config_path: str = "factory_flow_config.yaml", preloaded: Optional[Dict[str, Any]] = None):
         """
         Initialize the configuration manager.
 
         Args:
             config_path (str): Path to the YAML configuration file
+            preloaded (Optional[Dict[str, Any]]): Already parsed contents of config_path, used instead of
+                re-reading the file when provided
         """
         self.config_path = config_path
-        self.config = ConfigLoader.load_config(config_path)
+        self.config = preloaded if preloaded is not None else ConfigLoader.load_config(config_path)
         self.connection = BaseConnectionManager(self.config, "switch")
 
     def get_config(self, section: str) -> Dict[str, Any]:
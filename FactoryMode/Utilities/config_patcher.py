@@ -56,7 +56,8 @@ class ConfigPatcher:
     """Handles patching of YAML configuration files."""
 
     def __init__(self):
-        self.yaml_loader = yaml.SafeLoader
+        # libyaml's C loader parses the same documents much faster when PyYAML was built with it
+        self.yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         self.yaml_dumper = yaml.SafeDumper
 
     def load_yaml(self, file_path: str) -> Dict[str, Any]:
@@ -108,14 +108,16 @@ Authors:
 License:
     Copyright (c) 2025, NVIDIA CORPORATION. All rights reserved.
 """
+import codecs
 import concurrent.futures
 import inspect
 import os
 import re
+import sys
 import threading
 import time
 from threading import Lock
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 
 import yaml
 from rich.console import Group
@@ -123,7 +125,14 @@ from rich.live import Live
 from rich.panel import Panel
 
 from FactoryMode.flow_progress_tracker import FlowProgressTracker
-from FactoryMode.flow_types import DeviceType, FlowStep, IndependentFlow, OutputMode, ParallelFlowStep
+from FactoryMode.flow_types import (
+    DeviceType,
+    FlowStep,
+    FrozenParameters,
+    IndependentFlow,
+    OutputMode,
+    ParallelFlowStep,
+)
 from FactoryMode.output_manager import (
     OutputModeManager,
     get_log_directory,
@@ -141,6 +150,7 @@ from FactoryMode.TrayFlowFunctions.compute_factory_flow_functions import (
     ComputeFactoryFlow,
     ComputeFactoryFlowConfig,
 )
+from FactoryMode.TrayFlowFunctions.config_utils import SAFE_YAML_LOADER
 from FactoryMode.TrayFlowFunctions.power_shelf_factory_flow_functions import (
     PowerShelfFactoryFlow,
     PowerShelfFactoryFlowConfig,
@@ -149,6 +159,41 @@ from FactoryMode.TrayFlowFunctions.switch_factory_flow_functions import SwitchFa
 
 # RealTimeElapsedColumn moved to output_manager.py
 
+# Matches a ${variable_name} reference in flow files
+_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Fields every flow step must define, and the device_type values they may use. Steps look their
+# DeviceType up here instead of going through the Enum constructor.
+_REQUIRED_STEP_FIELDS = ("device_type", "device_id", "operation")
+_DEVICE_TYPES_BY_VALUE: Dict[str, DeviceType] = {device_type.value: device_type for device_type in DeviceType}
+
+# Parallel groups up to this size are joined in submission order instead of via concurrent.futures.wait
+_SMALL_PARALLEL_GROUP_SIZE = 4
+
+
+def _fast_yaml_load(stream: Any) -> Any:
+    """Parse YAML with the same semantics as yaml.safe_load, using the C loader when available."""
+    return yaml.load(stream, Loader=SAFE_YAML_LOADER)
+
+
+def _intern_name(value: Any) -> Any:
+    """
+    Intern tag, flow and handler names so the lookups keyed on them can match by identity.
+
+    The same few names are referenced from many steps and compared on every jump and optional flow
+    lookup; non-string values (e.g. None for unset fields) are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _iter_flow_steps(step: Union[FlowStep, ParallelFlowStep, IndependentFlow]) -> Iterator[FlowStep]:
+    """Yield every FlowStep contained in a step, including those inside parallel groups and independent flows."""
+    if isinstance(step, FlowStep):
+        yield step
+    elif isinstance(step, (ParallelFlowStep, IndependentFlow)):
+        for sub_step in step.steps:
+            yield from _iter_flow_steps(sub_step)
+
 
 class FactoryFlowOrchestrator:
     """Orchestrates factory flow operations across different device types."""
@@ -169,6 +214,10 @@ class FactoryFlowOrchestrator:
         # Thread safety for lazy initialization
         self._config_lock = Lock()
 
+        # Parsed main config shared by variables, retry defaults and device configs,
+        # stored as a single (file signature, config) tuple so readers never see a torn update
+        self._raw_config_entry: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+
         # Load variables from config first
         self.variables = self._load_variables()
 
@@ -194,6 +243,41 @@ class FactoryFlowOrchestrator:
         self.switch_flows: Dict[str, SwitchFactoryFlow] = {}
         self.power_shelf_flows: Dict[str, PowerShelfFactoryFlow] = {}
 
+        # Most recently used (device type, device id, flow), checked before the dispatch table
+        self._last_device_flow: Optional[Tuple[DeviceType, str, Any]] = None
+
+        # Per device type flow cache and factory used by _get_device_flow
+        self._device_dispatch: Dict[DeviceType, Tuple[Dict[str, Any], Callable[[str], Any]]] = {
+            DeviceType.COMPUTE: (
+                self.compute_flows,
+                lambda device_id: ComputeFactoryFlow(
+                    self.compute_config, device_id, console_output=self.console_output_enabled
+                ),
+            ),
+            DeviceType.SWITCH: (
+                self.switch_flows,
+                lambda device_id: SwitchFactoryFlow(
+                    self.switch_config, device_id, console_output=self.console_output_enabled
+                ),
+            ),
+            DeviceType.POWER_SHELF: (
+                self.power_shelf_flows,
+                lambda device_id: PowerShelfFactoryFlow(self.power_shelf_config, device_id),
+            ),
+        }
+
+        # Worker pool shared by all parallel step groups, created on first use
+        self.max_parallel_workers = int(self.variables.get("max_parallel_workers", 32))
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pool_lock = Lock()
+
+        # Bound device operations keyed by (device type, device id, operation name)
+        self._op_cache: Dict[Tuple[DeviceType, str, str], Callable] = {}
+        # Public operations per device flow class, used to reject unknown step operations up front
+        self._ops_by_class: Dict[type, FrozenSet[str]] = {}
+        # Shared read-only parameter mappings for the flow being loaded, keyed by their contents
+        self._param_intern: Dict[FrozenSet[Tuple[Any, type, Any]], FrozenParameters] = {}
+
         # Initialize error handlers
         self.error_handlers: Dict[str, Callable] = {}
         self.default_error_handler: Optional[str] = None
@@ -201,10 +285,11 @@ class FactoryFlowOrchestrator:
         # Initialize optional flows
         self.optional_flows: Dict[str, List[Union[FlowStep, ParallelFlowStep, IndependentFlow]]] = {}
 
-        # Initialize progress tracking with thread safety
-        self.progress_lock = Lock()
-        self.table_lock = Lock()
-        self.steps_lock = Lock()
+        # Initialize progress tracking with thread safety (reentrant so error handlers
+        # invoked while a lock is held can safely re-acquire it)
+        self.progress_lock = threading.RLock()
+        self.table_lock = threading.RLock()
+        self.steps_lock = threading.RLock()
         self._thread_local = threading.local()
 
         # Initialize output manager first (centralized output control)
@@ -229,7 +314,7 @@ class FactoryFlowOrchestrator:
             with self._config_lock:
                 # Double-check pattern to prevent race conditions
                 if self._compute_config is None:
-                    self._compute_config = ComputeFactoryFlowConfig(self.config_path)
+                    self._compute_config = ComputeFactoryFlowConfig(self.config_path, preloaded=self._get_raw_config())
         return self._compute_config
 
     @compute_config.setter
@@ -244,7 +329,7 @@ class FactoryFlowOrchestrator:
             with self._config_lock:
                 # Double-check pattern to prevent race conditions
                 if self._switch_config is None:
-                    self._switch_config = SwitchFactoryFlowConfig(self.config_path)
+                    self._switch_config = SwitchFactoryFlowConfig(self.config_path, preloaded=self._get_raw_config())
         return self._switch_config
 
     @switch_config.setter
@@ -259,7 +344,9 @@ class FactoryFlowOrchestrator:
             with self._config_lock:
                 # Double-check pattern to prevent race conditions
                 if self._power_shelf_config is None:
-                    self._power_shelf_config = PowerShelfFactoryFlowConfig(self.config_path)
+                    self._power_shelf_config = PowerShelfFactoryFlowConfig(
+                        self.config_path, preloaded=self._get_raw_config()
+                    )
         return self._power_shelf_config
 
     @power_shelf_config.setter
@@ -267,6 +354,28 @@ class FactoryFlowOrchestrator:
         """Allow setting power shelf config (needed for tests)."""
         self._power_shelf_config = value
 
+    def _get_raw_config(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsed main configuration file, re-parsing only when it changes on disk.
+
+        Returns:
+            Optional[Dict[str, Any]]: Parsed configuration, or None if the file does not exist
+        """
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._raw_config_entry
+        if entry is None or entry[0] != signature:
+            # Hand the raw bytes to the loader in one read; it detects the encoding itself
+            with open(self.config_path, "rb") as f:
+                config = _fast_yaml_load(f.read()) or {}
+            entry = (signature, config)
+            self._raw_config_entry = entry
+        return entry[1]
+
     def _get_default_retry_count(self) -> int:
         """
         Get default retry count without triggering device config creation.
@@ -289,11 +398,10 @@ class FactoryFlowOrchestrator:
             if "default_retry_count" in settings:
                 return settings["default_retry_count"]
 
-        # Fallback: load directly from main config file (avoid triggering initialization)
+        # Fallback: read from the cached main config (avoid triggering initialization)
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, encoding="utf-8") as f:
-                    config = yaml.safe_load(f)
+            config = self._get_raw_config()
+            if config is not None:
                 settings = config.get("settings", {})
                 if "default_retry_count" in settings:
                     return settings["default_retry_count"]
@@ -333,6 +441,22 @@ class FactoryFlowOrchestrator:
 
         self.error_handlers[name] = handler
 
+    @staticmethod
+    def _fmt_step_error(step: FlowStep, detail: str, include_device: bool = True) -> str:
+        """
+        Format the "<device> - Step <name> <detail>" message shared by the step failure paths.
+
+        Args:
+            step (FlowStep): The step the message is about
+            detail (str): What happened to the step, e.g. "failed: <error>"
+            include_device (bool): Prefix the message with the step's device id
+
+        Returns:
+            str: Formatted message
+        """
+        message = f"Step {step.name or step.operation} {detail}"
+        return f"{step.device_id} - {message}" if include_device else message
+
     def _default_error_handler(self, step: FlowStep, error: Exception, _context: Dict[str, Any]) -> bool:
         """
         Default error handler implementation.
@@ -345,7 +469,7 @@ class FactoryFlowOrchestrator:
         Returns:
             bool: True to continue flow, False to abort
         """
-        self.logger.error(f"{step.device_id} - Step {step.name or step.operation} failed: {str(error)}")
+        self.logger.error(self._fmt_step_error(step, f"failed: {str(error)}"))
         return False
 
     def _execute_error_handler(self, step: FlowStep, error: Exception, context: Dict[str, Any]) -> bool:
@@ -463,31 +587,31 @@ class FactoryFlowOrchestrator:
             error = original_exception
         else:
             # Create descriptive error message (fallback for cases where original exception not available)
+            detail = f"failed after {retry_attempts} retries"
             if optional_flow_executed:
-                error_message = (
-                    f"Step {step.name or step.operation} failed after "
-                    f"{retry_attempts} retries and optional flow {optional_flow_executed}"
-                )
-            else:
-                error_message = f"Step {step.name or step.operation} failed after {retry_attempts} retries"
+                detail += f" and optional flow {optional_flow_executed}"
 
-            error = RuntimeError(error_message)
+            error = RuntimeError(self._fmt_step_error(step, detail, include_device=False))
 
         # Execute error handler (diagnostic only - does not attempt recovery)
-        self.logger.info(f"{step.device_id} - Executing error handler for step {step.name or step.operation}")
+        self.logger.info("%s - Executing error handler for step %s", step.device_id, step.name or step.operation)
         handler_result = self._execute_error_handler(step, error, context)
 
         # Error handlers are diagnostic only and typically return False
         # Only return True if handler explicitly indicates flow should continue (rare case)
         if handler_result:
             self.logger.info(
-                f"{step.device_id} - Error handler indicates flow can continue for step {step.name or step.operation}"
+                "%s - Error handler indicates flow can continue for step %s",
+                step.device_id,
+                step.name or step.operation,
             )
             return True
 
         # Normal case: error handler completed diagnostic analysis, flow cannot continue
         self.logger.info(
-            f"{step.device_id} - Error handler diagnostic analysis complete for step {step.name or step.operation}, aborting flow"
+            "%s - Error handler diagnostic analysis complete for step %s, aborting flow",
+            step.device_id,
+            step.name or step.operation,
         )
         return False
 
@@ -530,23 +654,74 @@ class FactoryFlowOrchestrator:
         Returns:
             Union[ComputeFactoryFlow, SwitchFactoryFlow, PowerShelfFactoryFlow]: Flow instance
         """
-        if device_type == DeviceType.COMPUTE:
-            if device_id not in self.compute_flows:
-                self.compute_flows[device_id] = ComputeFactoryFlow(
-                    self.compute_config, device_id, console_output=self.console_output_enabled
-                )
-            return self.compute_flows[device_id]
-        if device_type == DeviceType.SWITCH:
-            if device_id not in self.switch_flows:
-                self.switch_flows[device_id] = SwitchFactoryFlow(
-                    self.switch_config, device_id, console_output=self.console_output_enabled
-                )
-            return self.switch_flows[device_id]
-        if device_type == DeviceType.POWER_SHELF:
-            if device_id not in self.power_shelf_flows:
-                self.power_shelf_flows[device_id] = PowerShelfFactoryFlow(self.power_shelf_config, device_id)
-            return self.power_shelf_flows[device_id]
-        raise ValueError(f"Unsupported device type: {device_type}")
+        # Consecutive steps usually target the same device; the tuple is replaced atomically
+        last = self._last_device_flow
+        if last is not None and last[0] is device_type and last[1] == device_id:
+            return last[2]
+
+        dispatch = self._device_dispatch.get(device_type)
+        if dispatch is None:
+            raise ValueError(f"Unsupported device type: {device_type}")
+
+        flows, factory = dispatch
+        flow = flows.get(device_id)
+        if flow is None:
+            flow = flows.setdefault(device_id, factory(device_id))
+        self._last_device_flow = (device_type, device_id, flow)
+        return flow
+
+    def _resolve_operation(self, flow: Any, step: FlowStep) -> Callable:
+        """
+        Get the bound device operation for a step, reusing the method bound on a previous call.
+
+        A cached method is only reused while it is still bound to the same flow instance and the
+        operation has not been overridden on that instance (e.g. patched in tests).
+
+        Args:
+            flow: Device flow instance returned by _get_device_flow
+            step (FlowStep): Step whose operation should be resolved
+
+        Returns:
+            Callable: Operation to invoke with the step parameters
+
+        Raises:
+            ValueError: If the flow class does not expose the operation
+        """
+        key = (step.device_type, step.device_id, step.operation)
+        cached = self._op_cache.get(key)
+        instance_attrs = getattr(flow, "__dict__", {})
+        if cached is not None and cached.__self__ is flow and step.operation not in instance_attrs:
+            return cached
+
+        if step.operation not in instance_attrs and step.operation not in self._get_supported_operations(type(flow)):
+            device_type = getattr(step.device_type, "value", step.device_type)
+            raise ValueError(
+                f"Unsupported operation '{step.operation}' for {device_type} device {step.device_id} "
+                f"({type(flow).__name__})"
+            )
+
+        operation = getattr(flow, step.operation)
+        if getattr(operation, "__self__", None) is flow and step.operation not in instance_attrs:
+            self._op_cache[key] = operation
+        return operation
+
+    def _get_supported_operations(self, flow_class: type) -> FrozenSet[str]:
+        """
+        Get the public operations a device flow class exposes to flow steps, computed once per class.
+
+        Args:
+            flow_class (type): Device flow class, e.g. ComputeFactoryFlow
+
+        Returns:
+            FrozenSet[str]: Names of public callable attributes of the class
+        """
+        operations = self._ops_by_class.get(flow_class)
+        if operations is None:
+            operations = frozenset(
+                name for name, _ in inspect.getmembers(flow_class, predicate=callable) if not name.startswith("_")
+            )
+            self._ops_by_class[flow_class] = operations
+        return operations
 
     def execute_step(self, step: FlowStep) -> bool:
         """
@@ -559,7 +734,7 @@ class FactoryFlowOrchestrator:
             bool: True if step was successful, False otherwise
         """
         step_name = step.name or step.operation
-        self.logger.info(f"{step.device_id} - Executing step: {step_name} on {step.device_type.value}")
+        self.logger.info("%s - Executing step: %s on %s", step.device_id, step_name, step.device_type.value)
 
         try:
             if step.operation == "execute_independent_flows":
@@ -568,7 +743,7 @@ class FactoryFlowOrchestrator:
                 return self.execute_parallel_flows(flows)
 
             flow = self._get_device_flow(step.device_type, step.device_id)
-            operation = getattr(flow, step.operation)
+            operation = self._resolve_operation(flow, step)
 
             # Execute operation with parameters
             result = operation(**step.parameters)
@@ -581,6 +756,124 @@ class FactoryFlowOrchestrator:
             # Don't call error handler here - let the retry logic handle it
             return False
 
+    def _get_shared_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Get the orchestrator-wide worker pool for parallel steps, creating it on first use.
+
+        Returns:
+            concurrent.futures.ThreadPoolExecutor: Shared executor
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.max_parallel_workers, thread_name_prefix="factory-flow"
+                    )
+        return self._pool
+
+    def _submit_to_shared_pool(
+        self, steps: List[FlowStep], max_workers: int
+    ) -> Dict[concurrent.futures.Future, FlowStep]:
+        """
+        Submit steps to the shared pool, running at most max_workers of them at a time.
+
+        Once a submitted step fails, the remaining steps are not submitted.
+
+        Args:
+            steps (List[FlowStep]): Steps to execute
+            max_workers (int): Concurrency cap for this group of steps
+
+        Returns:
+            Dict[concurrent.futures.Future, FlowStep]: Submitted futures mapped to their steps
+        """
+        pool = self._get_shared_pool()
+        slots = threading.BoundedSemaphore(max_workers)
+        step_failed = threading.Event()
+
+        def on_done(future: concurrent.futures.Future) -> None:
+            if future.cancelled() or future.exception() is not None or not future.result():
+                step_failed.set()
+            slots.release()
+
+        future_to_step = {}
+        for index, step in enumerate(steps):
+            slots.acquire()
+            if step_failed.is_set():
+                slots.release()
+                for skipped in steps[index:]:
+                    self.logger.warning(
+                        "Step %s skipped after an earlier parallel step failed", skipped.name or skipped.operation
+                    )
+                break
+            try:
+                future = pool.submit(self.execute_step, step)
+            except BaseException:
+                slots.release()
+                raise
+            future.add_done_callback(on_done)
+            future_to_step[future] = step
+        return future_to_step
+
+    def _collect_parallel_step_results(self, future_to_step: Dict[concurrent.futures.Future, FlowStep]) -> bool:
+        """
+        Wait for submitted parallel steps and log each failure.
+
+        On the first failure, steps that have not started yet are cancelled; steps that are
+        already running cannot be interrupted and are still waited for. Small groups are joined
+        in submission order, which avoids the waiter set up by concurrent.futures.wait per round.
+
+        Args:
+            future_to_step (Dict[concurrent.futures.Future, FlowStep]): Submitted futures mapped to their steps
+
+        Returns:
+            bool: True if all steps were successful, False otherwise
+        """
+        success = True
+        if len(future_to_step) <= _SMALL_PARALLEL_GROUP_SIZE:
+            futures = list(future_to_step)
+            for index, future in enumerate(futures):
+                if self._log_parallel_step_result(future, future_to_step[future]) is False:
+                    success = False
+                    for remaining in futures[index + 1 :]:
+                        remaining.cancel()
+            return success
+
+        pending = set(future_to_step)
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if self._log_parallel_step_result(future, future_to_step[future]) is False:
+                    success = False
+
+            if not success:
+                for future in pending:
+                    future.cancel()
+        return success
+
+    def _log_parallel_step_result(self, future: concurrent.futures.Future, step: FlowStep) -> Optional[bool]:
+        """
+        Wait for one parallel step and log its failure or cancellation.
+
+        Args:
+            future (concurrent.futures.Future): Future of the submitted step
+            step (FlowStep): The step the future runs
+
+        Returns:
+            Optional[bool]: Step result, or None if the step was cancelled before it started
+        """
+        try:
+            if future.result():
+                return True
+            self.logger.error(self._fmt_step_error(step, "failed", include_device=False))
+        except concurrent.futures.CancelledError:
+            self.logger.warning(
+                self._fmt_step_error(step, "cancelled after an earlier parallel step failed", include_device=False)
+            )
+            return None
+        except Exception as e:
+            self.logger.error(self._fmt_step_error(step, f"raised an exception: {str(e)}", include_device=False))
+        return False
+
     def execute_parallel_steps(self, parallel_step: ParallelFlowStep) -> bool:
         """
         Execute a group of steps in parallel.
@@ -592,27 +885,29 @@ class FactoryFlowOrchestrator:
             bool: True if all steps were successful, False otherwise
         """
         step_name = parallel_step.name or "Parallel Steps"
-        self.logger.info(f"Executing parallel steps: {step_name}")
+        self.logger.info("Executing parallel steps: %s", step_name)
 
         max_workers = parallel_step.max_workers or len(parallel_step.steps)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all steps to the executor
-            future_to_step = {executor.submit(self.execute_step, step): step for step in parallel_step.steps}
-
-            # Wait for all steps to complete
-            success = True
-            for future in concurrent.futures.as_completed(future_to_step):
-                step = future_to_step[future]
-                try:
-                    if not future.result():
-                        success = False
-                        self.logger.error(f"Step {step.name or step.operation} failed")
-                except Exception as e:
-                    success = False
-                    self.logger.error(f"Step {step.name or step.operation} raised an exception: {str(e)}")
+        # Leaf device operations run on the shared pool. Nested independent flows block on
+        # their own workers, so they keep a dedicated executor to rule out pool starvation.
+        # Groups inside concurrently running flows also get their own executor, so one flow's
+        # group never queues behind another flow's long device operations.
+        use_shared_pool = (
+            max_workers <= self.max_parallel_workers
+            and not getattr(self._thread_local, "in_parallel_flow", False)
+            and not any(step.operation == "execute_independent_flows" for step in parallel_step.steps)
+        )
+        if use_shared_pool:
+            future_to_step = self._submit_to_shared_pool(parallel_step.steps, max_workers)
+            success = self._collect_parallel_step_results(future_to_step)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all steps to the executor
+                future_to_step = {executor.submit(self.execute_step, step): step for step in parallel_step.steps}
+                success = self._collect_parallel_step_results(future_to_step)
 
         if parallel_step.wait_after_seconds > 0:
-            self.logger.info(f"Waiting {parallel_step.wait_after_seconds} seconds after parallel steps")
+            self.logger.info("Waiting %s seconds after parallel steps", parallel_step.wait_after_seconds)
             time.sleep(parallel_step.wait_after_seconds)
 
         return success
@@ -1031,7 +1326,9 @@ class FactoryFlowOrchestrator:
             retry_start = time.time()
 
             if attempt > 0:
-                self.logger.info(f"{step.device_id} - Retry attempt {attempt}/{step.retry_count} for step {step_name}")
+                self.logger.info(
+                    "%s - Retry attempt %s/%s for step %s", step.device_id, attempt, step.retry_count, step_name
+                )
                 # Update status for retry attempts
                 status = f"retrying (attempt {attempt + 1})"
                 self.progress_tracker.update_step_execution(flow_name, execution_id, status)
@@ -1039,7 +1336,10 @@ class FactoryFlowOrchestrator:
                 # Wait between retries if specified
                 if step.wait_between_retries_seconds > 0:
                     self.logger.info(
-                        f"{step.device_id} - Waiting {step.wait_between_retries_seconds} seconds between retries for {step_name}"
+                        "%s - Waiting %s seconds between retries for %s",
+                        step.device_id,
+                        step.wait_between_retries_seconds,
+                        step_name,
                     )
                     time.sleep(step.wait_between_retries_seconds)
 
@@ -1057,7 +1357,10 @@ class FactoryFlowOrchestrator:
                     # Wait after step if specified
                     if step.wait_after_seconds > 0:
                         self.logger.info(
-                            f"{step.device_id} - Waiting {step.wait_after_seconds} seconds after operation {step_name}"
+                            "%s - Waiting %s seconds after operation %s",
+                            step.device_id,
+                            step.wait_after_seconds,
+                            step_name,
                         )
                         time.sleep(step.wait_after_seconds)
 
@@ -1327,7 +1630,7 @@ class FactoryFlowOrchestrator:
         """Single parallel execution method for both GUI and non-GUI modes."""
         with concurrent.futures.ThreadPoolExecutor(max_workers=len(flows)) as executor:
             # Submit all flows to the executor
-            future_to_flow = {executor.submit(self.execute_independent_flow, flow): flow for flow in flows}
+            future_to_flow = {executor.submit(self._execute_parallel_flow, flow): flow for flow in flows}
 
             # Wait for all flows to complete
             success = True
@@ -1347,6 +1650,22 @@ class FactoryFlowOrchestrator:
 
         return success
 
+    def _execute_parallel_flow(self, flow: IndependentFlow) -> bool:
+        """
+        Execute one of several concurrently running flows, marking its worker thread as such.
+
+        Args:
+            flow (IndependentFlow): Flow to execute
+
+        Returns:
+            bool: True if the flow was successful, False otherwise
+        """
+        self._thread_local.in_parallel_flow = True
+        try:
+            return self.execute_independent_flow(flow)
+        finally:
+            self._thread_local.in_parallel_flow = False
+
     def execute_optional_flow(
         self,
         *,
@@ -1401,7 +1720,7 @@ class FactoryFlowOrchestrator:
 
     def _collect_error_handler_names(self, flow_config: Dict[str, Any]) -> Set[str]:
         """
-        Recursively collect all error handler names from a flow configuration.
+        Collect all error handler names from a flow configuration.
 
         Args:
             flow_config (Dict[str, Any]): Flow configuration dictionary
@@ -1416,29 +1735,16 @@ class FactoryFlowOrchestrator:
         if "execute_on_error" in settings:
             handler_names.add(settings["execute_on_error"])
 
-        # Process steps
-        for step in flow_config.get("steps", []):
-            # Check for error handler in step
+        # Process steps at any nesting depth (parallel, nested and independent flow steps)
+        stack = list(flow_config.get("steps", []))
+        while stack:
+            step = stack.pop()
             if "execute_on_error" in step:
                 handler_names.add(step["execute_on_error"])
-
-            # Check parallel steps
-            if "parallel" in step:
-                for parallel_step in step["parallel"]:
-                    if "execute_on_error" in parallel_step:
-                        handler_names.add(parallel_step["execute_on_error"])
-
-            # Check independent flows
-            if "independent_flows" in step:
-                for flow in step["independent_flows"]:
-                    for sub_step in flow.get("steps", []):
-                        if "execute_on_error" in sub_step:
-                            handler_names.add(sub_step["execute_on_error"])
-                        # Check nested steps
-                        if "steps" in sub_step:
-                            for nested_step in sub_step["steps"]:
-                                if "execute_on_error" in nested_step:
-                                    handler_names.add(nested_step["execute_on_error"])
+            stack.extend(step.get("parallel", ()))
+            stack.extend(step.get("steps", ()))
+            for flow in step.get("independent_flows", ()):
+                stack.extend(flow.get("steps", ()))
 
         return handler_names
 
@@ -1450,17 +1756,14 @@ class FactoryFlowOrchestrator:
             flow_config (Dict[str, Any]): Flow configuration dictionary
         """
         handler_names = self._collect_error_handler_names(flow_config)
+        module_globals = globals()
 
         for handler_name in handler_names:
             if handler_name not in self.error_handlers:
-                handler = None
-
-                # Check if handler exists in global namespace
-                if handler_name in globals():
-                    handler = globals()[handler_name]
-                # Check if handler exists in imported error_handlers module
-                elif hasattr(error_handlers, handler_name):
-                    handler = getattr(error_handlers, handler_name)
+                # Check if handler exists in global namespace, then in the imported error_handlers module
+                handler = module_globals.get(handler_name)
+                if handler is None:
+                    handler = getattr(error_handlers, handler_name, None)
 
                 if handler is not None:
                     # Verify it's a callable with the correct signature
@@ -1485,7 +1788,32 @@ class FactoryFlowOrchestrator:
         """
         optional_flows = flow_config.get("optional_flows", {})
         for flow_name, flow_steps in optional_flows.items():
-            self.optional_flows[flow_name] = self._convert_steps_to_flow_objects(flow_steps)
+            self.optional_flows[_intern_name(flow_name)] = self._convert_steps_to_flow_objects(flow_steps)
+
+    def _intern_parameters(self, step_config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the parameters of a step, sharing one mapping between steps with identical values.
+
+        Parameters holding unhashable values (lists, nested dicts) are kept as-is.
+
+        Args:
+            step_config (Dict[str, Any]): Step configuration dictionary
+
+        Returns:
+            Dict[str, Any]: Parameters for the step
+        """
+        params = step_config.get("parameters", {})
+        if not isinstance(params, dict):
+            return params
+        try:
+            # Value types are part of the key so that e.g. 1, 1.0 and True are not merged
+            key = frozenset((name, type(value), value) for name, value in params.items())
+            shared = self._param_intern.get(key)
+        except TypeError:
+            return params
+        if shared is None:
+            shared = self._param_intern[key] = FrozenParameters(params)
+        return shared
 
     def _validate_step_fields(self, step_config: Dict[str, Any], location: str) -> None:
         """
@@ -1501,8 +1829,7 @@ class FactoryFlowOrchestrator:
         step_name = step_config.get("name", "unnamed step")
 
         # Check required fields
-        required_fields = ["device_type", "device_id", "operation"]
-        for field in required_fields:
+        for field in _REQUIRED_STEP_FIELDS:
             if field not in step_config:
                 raise ValueError(f"Missing required field '{field}' in step '{step_name}' at {location}")
             if not step_config[field]:  # Check for empty strings
@@ -1510,11 +1837,11 @@ class FactoryFlowOrchestrator:
 
         # Validate device_type is valid
         device_type = step_config["device_type"]
-        valid_types = ["compute", "switch", "power_shelf"]
-        if device_type not in valid_types:
+        # Non-string values (e.g. a YAML list) are unhashable and can never be valid
+        if not isinstance(device_type, str) or device_type not in _DEVICE_TYPES_BY_VALUE:
             raise ValueError(
                 f"Invalid device_type '{device_type}' in step '{step_name}' at {location}. "
-                f"Must be one of: {valid_types}"
+                f"Must be one of: {[valid_type.value for valid_type in DeviceType]}"
             )
 
         # Validate parameters is a dict if present
@@ -1524,6 +1851,36 @@ class FactoryFlowOrchestrator:
                 f"Must be a dictionary, got: {type(step_config['parameters']).__name__}"
             )
 
+    def _build_flow_step(self, step_config: Dict[str, Any], location: str, default_retry_count: int) -> FlowStep:
+        """
+        Validate a single step configuration and build its FlowStep.
+
+        Args:
+            step_config (Dict[str, Any]): Step configuration dictionary
+            location (str): Location description for error messages (e.g., "step[0]")
+            default_retry_count (int): Retry count used when the step does not set one
+
+        Returns:
+            FlowStep: The constructed step
+        """
+        self._validate_step_fields(step_config, location)
+        return FlowStep(
+            device_type=_DEVICE_TYPES_BY_VALUE[step_config["device_type"]],
+            device_id=step_config["device_id"],
+            operation=step_config["operation"],
+            parameters=self._intern_parameters(step_config),
+            retry_count=step_config.get("retry_count", default_retry_count),
+            timeout_seconds=step_config.get("timeout_seconds"),
+            wait_after_seconds=step_config.get("wait_after_seconds", 0),
+            wait_between_retries_seconds=step_config.get("wait_between_retries_seconds", 0),
+            name=step_config.get("name"),
+            execute_on_error=_intern_name(step_config.get("execute_on_error")),
+            execute_optional_flow=_intern_name(step_config.get("execute_optional_flow")),
+            jump_on_success=_intern_name(step_config.get("jump_on_success")),
+            jump_on_failure=_intern_name(step_config.get("jump_on_failure")),
+            tag=_intern_name(step_config.get("tag")),
+        )
+
     def _convert_steps_to_flow_objects(
         self, steps_config: List[Dict[str, Any]]
     ) -> List[Union[FlowStep, ParallelFlowStep, IndependentFlow]]:
@@ -1537,8 +1894,11 @@ class FactoryFlowOrchestrator:
             List[Union[FlowStep, ParallelFlowStep, IndependentFlow]]: List of flow objects
         """
         steps = []
+        # Parameter mappings are shared within one conversion only, so the intern table stays bounded
+        self._param_intern.clear()
         # Get default retry count without triggering config creation
         default_retry_count = self._get_default_retry_count()
+        build_step = self._build_flow_step
 
         for i, step_config in enumerate(steps_config):
             if "independent_flows" in step_config:
@@ -1548,30 +1908,14 @@ class FactoryFlowOrchestrator:
                     for k, sub_step in enumerate(flow_config.get("steps", [])):
                         if "steps" in sub_step:
                             # Handle nested parallel steps
-                            parallel_steps = []
-                            for m, nested_step in enumerate(sub_step["steps"]):
-                                # Validate before creating FlowStep
-                                self._validate_step_fields(
+                            parallel_steps = [
+                                build_step(
                                     nested_step,
                                     f"independent_flow[{j}].steps[{k}].steps[{m}]",
+                                    default_retry_count,
                                 )
-                                step = FlowStep(
-                                    device_type=DeviceType(nested_step["device_type"]),
-                                    device_id=nested_step["device_id"],
-                                    operation=nested_step["operation"],
-                                    parameters=nested_step.get("parameters", {}),
-                                    retry_count=nested_step.get("retry_count", default_retry_count),
-                                    timeout_seconds=nested_step.get("timeout_seconds"),
-                                    wait_after_seconds=nested_step.get("wait_after_seconds", 0),
-                                    wait_between_retries_seconds=nested_step.get("wait_between_retries_seconds", 0),
-                                    name=nested_step.get("name"),
-                                    execute_on_error=nested_step.get("execute_on_error"),
-                                    execute_optional_flow=nested_step.get("execute_optional_flow"),
-                                    jump_on_success=nested_step.get("jump_on_success"),
-                                    jump_on_failure=nested_step.get("jump_on_failure"),
-                                    tag=nested_step.get("tag"),
-                                )
-                                parallel_steps.append(step)
+                                for m, nested_step in enumerate(sub_step["steps"])
+                            ]
                             parallel_step = ParallelFlowStep(
                                 steps=parallel_steps,
                                 name=sub_step.get("name"),
@@ -1581,25 +1925,9 @@ class FactoryFlowOrchestrator:
                             flow_steps.append(parallel_step)
                         else:
                             # Handle single step
-                            # Validate before creating FlowStep
-                            self._validate_step_fields(sub_step, f"independent_flow[{j}].steps[{k}]")
-                            step = FlowStep(
-                                device_type=DeviceType(sub_step["device_type"]),
-                                device_id=sub_step["device_id"],
-                                operation=sub_step["operation"],
-                                parameters=sub_step.get("parameters", {}),
-                                retry_count=sub_step.get("retry_count", default_retry_count),
-                                timeout_seconds=sub_step.get("timeout_seconds"),
-                                wait_after_seconds=sub_step.get("wait_after_seconds", 0),
-                                wait_between_retries_seconds=sub_step.get("wait_between_retries_seconds", 0),
-                                name=sub_step.get("name"),
-                                execute_on_error=sub_step.get("execute_on_error"),
-                                execute_optional_flow=sub_step.get("execute_optional_flow"),
-                                jump_on_success=sub_step.get("jump_on_success"),
-                                jump_on_failure=sub_step.get("jump_on_failure"),
-                                tag=sub_step.get("tag"),
+                            flow_steps.append(
+                                build_step(sub_step, f"independent_flow[{j}].steps[{k}]", default_retry_count)
                             )
-                            flow_steps.append(step)
 
                     flow = IndependentFlow(
                         steps=flow_steps,
@@ -1611,48 +1939,13 @@ class FactoryFlowOrchestrator:
             elif "steps" in step_config:
                 # Handle nested steps - execute sequentially
                 for m, nested_step in enumerate(step_config["steps"]):
-                    # Validate before creating FlowStep
-                    self._validate_step_fields(nested_step, f"step[{i}].steps[{m}]")
-                    step = FlowStep(
-                        device_type=DeviceType(nested_step["device_type"]),
-                        device_id=nested_step["device_id"],
-                        operation=nested_step["operation"],
-                        parameters=nested_step.get("parameters", {}),
-                        retry_count=nested_step.get("retry_count", default_retry_count),
-                        timeout_seconds=nested_step.get("timeout_seconds"),
-                        wait_after_seconds=nested_step.get("wait_after_seconds", 0),
-                        wait_between_retries_seconds=nested_step.get("wait_between_retries_seconds", 0),
-                        name=nested_step.get("name"),
-                        execute_on_error=nested_step.get("execute_on_error"),
-                        execute_optional_flow=nested_step.get("execute_optional_flow"),
-                        jump_on_success=nested_step.get("jump_on_success"),
-                        jump_on_failure=nested_step.get("jump_on_failure"),
-                        tag=nested_step.get("tag"),
-                    )
-                    steps.append(step)
+                    steps.append(build_step(nested_step, f"step[{i}].steps[{m}]", default_retry_count))
             elif "parallel" in step_config:
                 # Handle parallel steps - special case
-                parallel_steps = []
-                for m, parallel_step_config in enumerate(step_config["parallel"]):
-                    # Validate before creating FlowStep
-                    self._validate_step_fields(parallel_step_config, f"step[{i}].parallel[{m}]")
-                    step = FlowStep(
-                        device_type=DeviceType(parallel_step_config["device_type"]),
-                        device_id=parallel_step_config["device_id"],
-                        operation=parallel_step_config["operation"],
-                        parameters=parallel_step_config.get("parameters", {}),
-                        retry_count=parallel_step_config.get("retry_count", default_retry_count),
-                        timeout_seconds=parallel_step_config.get("timeout_seconds"),
-                        wait_after_seconds=parallel_step_config.get("wait_after_seconds", 0),
-                        wait_between_retries_seconds=parallel_step_config.get("wait_between_retries_seconds", 0),
-                        name=parallel_step_config.get("name"),
-                        execute_on_error=parallel_step_config.get("execute_on_error"),
-                        execute_optional_flow=parallel_step_config.get("execute_optional_flow"),
-                        jump_on_success=parallel_step_config.get("jump_on_success"),
-                        jump_on_failure=parallel_step_config.get("jump_on_failure"),
-                        tag=parallel_step_config.get("tag"),
-                    )
-                    parallel_steps.append(step)
+                parallel_steps = [
+                    build_step(parallel_step_config, f"step[{i}].parallel[{m}]", default_retry_count)
+                    for m, parallel_step_config in enumerate(step_config["parallel"])
+                ]
 
                 # Create ParallelFlowStep
                 parallel_flow = ParallelFlowStep(
@@ -1664,42 +1957,55 @@ class FactoryFlowOrchestrator:
                 steps.append(parallel_flow)
             else:
                 # Handle single step
-                # Validate before creating FlowStep
-                self._validate_step_fields(step_config, f"step[{i}]")
-                step = FlowStep(
-                    device_type=DeviceType(step_config["device_type"]),
-                    device_id=step_config["device_id"],
-                    operation=step_config["operation"],
-                    parameters=step_config.get("parameters", {}),
-                    retry_count=step_config.get("retry_count", default_retry_count),
-                    timeout_seconds=step_config.get("timeout_seconds"),
-                    wait_after_seconds=step_config.get("wait_after_seconds", 0),
-                    wait_between_retries_seconds=step_config.get("wait_between_retries_seconds", 0),
-                    name=step_config.get("name"),
-                    execute_on_error=step_config.get("execute_on_error"),
-                    execute_optional_flow=step_config.get("execute_optional_flow"),
-                    jump_on_success=step_config.get("jump_on_success"),
-                    jump_on_failure=step_config.get("jump_on_failure"),
-                    tag=step_config.get("tag"),
-                )
-                steps.append(step)
+                steps.append(build_step(step_config, f"step[{i}]", default_retry_count))
 
         return steps
 
     def _load_variables(self) -> Dict[str, Any]:
         """Load variables from configuration file."""
-        if not os.path.exists(self.config_path):
+        config = self._get_raw_config()
+        if config is None:
             self.logger.warning(f"Configuration file not found: {self.config_path}")
             return {}
 
-        with open(self.config_path, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
         return config.get("variables", {})
 
+    def _substitute_variable(self, match: re.Match) -> str:
+        """
+        Replacement callback for _VAR_RE returning the value of one ${variable} reference.
+
+        Args:
+            match: Regex match of a single variable reference
+
+        Returns:
+            str: Variable value, or the original text for malformed references
+
+        Raises:
+            ValueError: If the referenced variable is not defined
+        """
+        var_name = match.group(1)
+        # Skip malformed patterns such as nested "${${name}"
+        if var_name.startswith("${"):
+            return match.group(0)
+
+        if var_name in self.variables:
+            return str(self.variables[var_name])
+
+        # Undefined variables should cause flow loading to fail
+        raise ValueError(
+            f"Undefined variable '{var_name}' referenced in flow configuration. "
+            f"Variable must be defined in config file under 'variables' section. "
+            f"Available variables: {list(self.variables.keys())}"
+        )
+
     def _expand_variables(self, value: Any) -> Any:
         """
-        Recursively expand variables in a value.
+        Expand variables in a value, including inside nested dicts and lists.
+
+        Containers are copied with an explicit worklist rather than recursion, so deeply nested
+        YAML cannot hit the interpreter recursion limit. Large flow files repeat the same templated
+        strings (bundle paths, device ids) many times, so each distinct string is expanded once per
+        call and reused afterwards.
 
         Args:
             value: The value to expand variables in
@@ -1707,42 +2013,37 @@ class FactoryFlowOrchestrator:
         Returns:
             The value with variables expanded
         """
-        if isinstance(value, str):
-            # Check if the string contains a variable reference
-            if "${" in value and "}" in value:
-                # Find all well-formed variable references
-                pattern = r"\${([^}]+)}"
-                matches = list(re.finditer(pattern, value))
-
-                # Only process if we found complete matches
-                if matches:
-                    # Replace each variable reference
-                    result = value
-                    for match in matches:
-                        var_name = match.group(1)
-                        # Skip empty variable names or malformed patterns
-                        if not var_name or var_name.startswith("${"):
-                            continue
+        memo: Dict[str, str] = {}
 
-                        if var_name in self.variables:
-                            var_value = str(self.variables[var_name])
-                            result = result.replace(match.group(0), var_value)
-                        else:
-                            # Undefined variables should cause flow loading to fail
-                            raise ValueError(
-                                f"Undefined variable '{var_name}' referenced in flow configuration. "
-                                f"Variable must be defined in config file under 'variables' section. "
-                                f"Available variables: {list(self.variables.keys())}"
-                            )
-                    return result
-                # No complete variable patterns found, return as-is
-                return value
+        def expand_str(item: str) -> str:
+            expanded = memo.get(item)
+            if expanded is None:
+                expanded = memo[item] = _VAR_RE.sub(self._substitute_variable, item)
+            return expanded
+
+        # Most values are plain strings without references; a single substring check skips the regex
+        if isinstance(value, str):
+            return expand_str(value) if "${" in value else value
+        if not isinstance(value, (dict, list)):
             return value
-        if isinstance(value, dict):
-            return {k: self._expand_variables(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [self._expand_variables(item) for item in value]
-        return value
+
+        result: Any = {} if isinstance(value, dict) else []
+        worklist = [(value, result)]
+        while worklist:
+            source, target = worklist.pop()
+            for key, item in source.items() if isinstance(source, dict) else enumerate(source):
+                if isinstance(item, (dict, list)):
+                    # Attach the empty copy now and fill it when it comes off the worklist
+                    child: Any = {} if isinstance(item, dict) else []
+                    worklist.append((item, child))
+                    item = child
+                elif isinstance(item, str) and "${" in item:
+                    item = expand_str(item)
+                if isinstance(target, dict):
+                    target[key] = item
+                else:
+                    target.append(item)
+        return result
 
     def load_flow_from_yaml(self, flow_path: str) -> List[Union[FlowStep, ParallelFlowStep, IndependentFlow]]:
         """
@@ -1759,8 +2060,10 @@ class FactoryFlowOrchestrator:
 
         self.logger.info(f"Loading flow from YAML file: {flow_path}")
 
-        with open(flow_path, encoding="utf-8") as f:
-            flow_config = yaml.safe_load(f)
+        # Parse straight from the file bytes; the loader does the decoding without an intermediate str
+        with open(flow_path, "rb") as f:
+            raw_bytes = f.read()
+        flow_config = _fast_yaml_load(raw_bytes)
 
         self.logger.info(f"YAML loaded successfully. Top-level keys: {list(flow_config.keys())}")
 
@@ -1775,8 +2078,12 @@ class FactoryFlowOrchestrator:
         main_steps_raw = flow_config.get("steps", [])
         self.logger.info(f"Found {len(main_steps_raw)} main flow steps in YAML")
 
-        # Expand variables in the flow configuration
-        flow_config = self._expand_variables(flow_config)
+        # Expand variables in the flow configuration. Skip the full tree walk when the file has no
+        # variable references; backslashes are treated as possible references since YAML escapes
+        # can produce "${" in the parsed value. The byte check only holds for UTF-8, so UTF-16
+        # files (which the loader detects by their BOM) are always expanded.
+        if b"${" in raw_bytes or b"\\" in raw_bytes or raw_bytes.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            flow_config = self._expand_variables(flow_config)
 
         # Register any new error handlers found in the flow configuration
         self._register_error_handlers_from_config(flow_config)
@@ -1799,8 +2106,25 @@ class FactoryFlowOrchestrator:
 
         return main_flow_steps
 
+    def __enter__(self):
+        """Allow the orchestrator to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Release all resources when leaving the context."""
+        self.close()
+
     def close(self):
         """Close all connections and cleanup resources."""
+        # Stop the shared parallel step pool
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+        # Persist any step-level progress update still waiting for its deferred write
+        self.progress_tracker.flush()
+
         # Only close configs that were actually created
         if self._compute_config is not None:
             self._compute_config.close()
@@ -1822,65 +2146,85 @@ class FactoryFlowOrchestrator:
         Raises:
             ValueError: If validation fails
         """
-        # Collect all tags and check for duplicates
-        all_tags = []
-        tag_locations = {}  # tag -> (location, step_name)
-
-        def collect_tags_from_steps(steps: List[Dict[str, Any]], location: str):
-            """Recursively collect tags from steps."""
-            for i, step in enumerate(steps):
-                if "tag" in step and step["tag"]:
-                    tag = step["tag"]
-                    step_name = step.get("name", f"Step {i+1}")
-                    if tag in all_tags:
-                        raise ValueError(
-                            f"Duplicate tag '{tag}' found. "
-                            f"First occurrence: {tag_locations[tag][1]} in {tag_locations[tag][0]}. "
-                            f"Second occurrence: {step_name} in {location}"
-                        )
-                    all_tags.append(tag)
-                    tag_locations[tag] = (location, step_name)
-
-                # Check nested structures
-                if "parallel" in step:
-                    collect_tags_from_steps(step["parallel"], f"{location} -> parallel steps")
-                if "steps" in step:
-                    collect_tags_from_steps(step["steps"], f"{location} -> nested steps")
-                if "independent_flows" in step:
-                    for flow in step["independent_flows"]:
-                        if "steps" in flow:
-                            flow_name = flow.get("name", "unnamed flow")
-                            collect_tags_from_steps(flow["steps"], f"{location} -> {flow_name}")
-
-        # Collect tags from main steps
         main_steps = flow_config.get("steps", [])
-        collect_tags_from_steps(main_steps, "main flow")
-
-        # Collect tags from optional flows
         optional_flows = flow_config.get("optional_flows", {})
+
+        # Walk the step tree once; tag collection and reference validation both iterate this list.
+        # Each entry is (step, index in its list, location for tag messages, location for reference messages,
+        # name of the optional flow containing the step or None for the main flow).
+        flat_steps: List[Tuple[Dict[str, Any], int, str, str, Optional[str]]] = []
+
+        def step_entries(steps: List[Dict[str, Any]], tag_location: str, ref_location: str, owner: Optional[str]):
+            """Build flat_steps entries for one list of steps."""
+            return [(step, i, tag_location, f"{ref_location}[{i}]", owner) for i, step in enumerate(steps)]
+
+        roots = step_entries(main_steps, "main flow", "main flow", None)
         for flow_name, flow_steps in optional_flows.items():
-            collect_tags_from_steps(flow_steps, f"optional flow '{flow_name}'")
+            roots += step_entries(flow_steps, f"optional flow '{flow_name}'", f"optional flow '{flow_name}'", flow_name)
+
+        # Iterative pre-order walk so deeply nested flows cannot hit the recursion limit. Children are
+        # pushed in reverse so steps come off the stack in document order.
+        stack = roots[::-1]
+        while stack:
+            entry = stack.pop()
+            flat_steps.append(entry)
+            step, _, tag_location, step_location, owner = entry
+
+            children = []
+            if "parallel" in step:
+                children += step_entries(
+                    step["parallel"], f"{tag_location} -> parallel steps", f"{step_location} -> parallel", owner
+                )
+            if "steps" in step:
+                children += step_entries(
+                    step["steps"], f"{tag_location} -> nested steps", f"{step_location} -> steps", owner
+                )
+            if "independent_flows" in step:
+                for j, flow in enumerate(step["independent_flows"]):
+                    if "steps" in flow:
+                        children += step_entries(
+                            flow["steps"],
+                            f"{tag_location} -> {flow.get('name', 'unnamed flow')}",
+                            f"{step_location} -> {flow.get('name', f'flow {j}')}",
+                            owner,
+                        )
+            stack.extend(reversed(children))
+
+        # Collect all tags and check for duplicates. tag_to_step serves as the set of known tags for jump
+        # target validation and as the lookup table for the circular jump check.
+        tag_to_step: Dict[str, Dict[str, Any]] = {}
+        tag_locations = {}  # tag -> (location, step_name)
+        for step, i, tag_location, _, _ in flat_steps:
+            if "tag" in step and step["tag"]:
+                tag = step["tag"]
+                step_name = step.get("name", f"Step {i+1}")
+                if tag in tag_to_step:
+                    raise ValueError(
+                        f"Duplicate tag '{tag}' found. "
+                        f"First occurrence: {tag_locations[tag][1]} in {tag_locations[tag][0]}. "
+                        f"Second occurrence: {step_name} in {tag_location}"
+                    )
+                tag_locations[tag] = (tag_location, step_name)
+                tag_to_step[tag] = step
+
+        # Handlers a step may reference: registered built-ins, the default handler and handlers
+        # declared in the flow file. Resolved once here rather than for every step.
+        known_handlers = set(error_handlers.get_handler_names())
+        known_handlers.add("default_error_handler")
+        error_handlers_in_config = flow_config.get("error_handlers", {})
 
         # Now validate references
         def validate_step_references(step: Dict[str, Any], location: str):
             """Validate references in a single step."""
             step_name = step.get("name", "unnamed step")
 
-            # Check jump targets
-            if "jump_on_success" in step and step["jump_on_success"]:
-                target = step["jump_on_success"]
-                if target not in all_tags:
+            # Check jump targets; the sorted tag list is only built for the error message
+            for jump_field in ("jump_on_success", "jump_on_failure"):
+                target = step.get(jump_field)
+                if target and target not in tag_to_step:
                     raise ValueError(
                         f"Invalid jump target '{target}' in step '{step_name}' at {location}. "
-                        f"Target tag does not exist. Available tags: {sorted(all_tags)}"
-                    )
-
-            if "jump_on_failure" in step and step["jump_on_failure"]:
-                target = step["jump_on_failure"]
-                if target not in all_tags:
-                    raise ValueError(
-                        f"Invalid jump target '{target}' in step '{step_name}' at {location}. "
-                        f"Target tag does not exist. Available tags: {sorted(all_tags)}"
+                        f"Target tag does not exist. Available tags: {sorted(tag_to_step)}"
                     )
 
             # Check optional flow references
@@ -1895,13 +2239,6 @@ class FactoryFlowOrchestrator:
             # Check error handler references
             if "execute_on_error" in step and step["execute_on_error"]:
                 handler_name = step["execute_on_error"]
-                # Get registered handlers from error_handlers module
-                known_handlers = error_handlers.get_handler_names()
-                # Add default handler if not in registry
-                if "default_error_handler" not in known_handlers:
-                    known_handlers.append("default_error_handler")
-                error_handlers_in_config = flow_config.get("error_handlers", {})
-
                 if (
                     handler_name not in self.error_handlers
                     and handler_name not in known_handlers
@@ -1913,41 +2250,30 @@ class FactoryFlowOrchestrator:
                         f"Known handlers: {sorted(known_handlers)}"
                     )
 
-        def validate_steps_recursively(steps: List[Dict[str, Any]], location: str):
-            """Recursively validate all steps."""
-            for i, step in enumerate(steps):
-                step_location = f"{location}[{i}]"
-                validate_step_references(step, step_location)
-
-                # Validate nested structures
-                if "parallel" in step:
-                    validate_steps_recursively(step["parallel"], f"{step_location} -> parallel")
-                if "steps" in step:
-                    validate_steps_recursively(step["steps"], f"{step_location} -> steps")
-                if "independent_flows" in step:
-                    for j, flow in enumerate(step["independent_flows"]):
-                        if "steps" in flow:
-                            flow_name = flow.get("name", f"flow {j}")
-                            validate_steps_recursively(flow["steps"], f"{step_location} -> {flow_name}")
-
-        # Validate all steps
-        validate_steps_recursively(main_steps, "main flow")
-
-        # Validate optional flows
-        for flow_name, flow_steps in optional_flows.items():
-            validate_steps_recursively(flow_steps, f"optional flow '{flow_name}'")
+        # Validate all steps, including optional flows
+        # Optional flow name -> optional flows referenced by any step inside it, for the cycle check. A dict
+        # with None values acts as an insertion-ordered set, so repeated references to the same flow
+        # become one edge while the DFS still follows them in document order.
+        flow_references: Dict[str, Dict[str, None]] = {flow_name: {} for flow_name in optional_flows}
+        for step, _, _, step_location, owner in flat_steps:
+            validate_step_references(step, step_location)
+            if owner is not None and step.get("execute_optional_flow"):
+                flow_references[owner][step["execute_optional_flow"]] = None
 
         # Check for circular jump dependencies
         def check_circular_jumps(all_tags: Dict[str, Dict[str, Any]]) -> None:
             """Check for circular dependencies in jump_on_failure references."""
+            # Each step has at most one jump_on_failure target, so every walk is a simple chain. Tags
+            # already shown to end without a cycle are shared across walks and stop later walks early.
+            cycle_free: Set[str] = set()
             for tag, step in all_tags.items():
                 if "jump_on_failure" in step and step["jump_on_failure"]:
-                    visited = set()
+                    on_path: Set[str] = set()
                     current = tag
                     path = []
 
-                    while current:
-                        if current in visited:
+                    while current and current not in cycle_free:
+                        if current in on_path:
                             # Found a cycle - reconstruct the cycle path
                             cycle_start_idx = path.index(current)
                             cycle_path = path[cycle_start_idx:] + [current]
@@ -1956,7 +2282,7 @@ class FactoryFlowOrchestrator:
                                 f"Steps cannot form a cycle through jump_on_failure references."
                             )
 
-                        visited.add(current)
+                        on_path.add(current)
                         path.append(current)
 
                         # Get the jump target for the current step
@@ -1966,69 +2292,43 @@ class FactoryFlowOrchestrator:
                         else:
                             current = None
 
-        # Build tag-to-step mapping for circular jump checking
-        tag_to_step = {}
-
-        def collect_tagged_steps(steps: List[Dict[str, Any]]):
-            """Collect all tagged steps into a mapping."""
-            for step in steps:
-                if "tag" in step and step["tag"]:
-                    tag_to_step[step["tag"]] = step
-
-                # Check nested structures
-                if "parallel" in step:
-                    collect_tagged_steps(step["parallel"])
-                if "steps" in step:
-                    collect_tagged_steps(step["steps"])
-                if "independent_flows" in step:
-                    for flow in step["independent_flows"]:
-                        if "steps" in flow:
-                            collect_tagged_steps(flow["steps"])
-
-        # Collect from main flow
-        collect_tagged_steps(main_steps)
-
-        # Collect from optional flows
-        for _flow_name, flow_steps in optional_flows.items():
-            collect_tagged_steps(flow_steps)
+                    cycle_free.update(path)
 
         # Now check for circular jumps
         check_circular_jumps(tag_to_step)
 
         # Check for circular optional flow references
-        def check_circular_optional_flows(optional_flows: Dict[str, List]) -> None:
+        def check_circular_optional_flows(adjacency: Dict[str, Dict[str, None]]) -> None:
             """Check for circular dependencies in execute_optional_flow references."""
-
-            def check_flow_recursively(flow_name: str, visited: Set[str], path: List[str]) -> None:
-                if flow_name in visited:
-                    # Found a cycle
-                    cycle_start = path.index(flow_name)
-                    cycle_path = path[cycle_start:] + [flow_name]
-                    raise ValueError(
-                        f"Circular optional flow reference detected: {' -> '.join(cycle_path)}. "
-                        f"Optional flows cannot form a cycle through execute_optional_flow references."
-                    )
-
-                visited.add(flow_name)
-                path.append(flow_name)
-
-                # Check steps in this optional flow for references to other optional flows
-                if flow_name in optional_flows:
-                    for step in optional_flows[flow_name]:
-                        if isinstance(step, dict) and "execute_optional_flow" in step and step["execute_optional_flow"]:
-                            check_flow_recursively(
-                                step["execute_optional_flow"],
-                                visited.copy(),
-                                path.copy(),
+            # Single iterative depth-first pass. Any cycle is rejected, so the first edge back to a flow
+            # on the current path is enough and full SCC bookkeeping is not needed. Flows whose
+            # references were fully explored are known acyclic and never revisited.
+            done: Set[str] = set()
+            for root in adjacency:
+                if root in done:
+                    continue
+                on_path = {root}
+                work = [(root, iter(adjacency[root]))]
+                while work:
+                    flow_name, references = work[-1]
+                    for target in references:
+                        if target in on_path:
+                            path = [name for name, _ in work]
+                            cycle_path = path[path.index(target) :] + [target]
+                            raise ValueError(
+                                f"Circular optional flow reference detected: {' -> '.join(cycle_path)}. "
+                                f"Optional flows cannot form a cycle through execute_optional_flow references."
                             )
+                        if target not in done:
+                            on_path.add(target)
+                            work.append((target, iter(adjacency[target])))
+                            break
+                    else:
+                        work.pop()
+                        on_path.discard(flow_name)
+                        done.add(flow_name)
 
-                path.pop()
-
-            # Check all optional flows
-            for flow_name in optional_flows:
-                check_flow_recursively(flow_name, set(), [])
-
-        check_circular_optional_flows(optional_flows)
+        check_circular_optional_flows(flow_references)
 
         self.logger.info("YAML flow validation completed successfully")
 
@@ -2047,20 +2347,5 @@ class FactoryFlowOrchestrator:
             target_index (int): Target step index (steps before this will have flags reset)
         """
         for i in range(target_index):
-            step = steps[i]
-            if isinstance(step, FlowStep):
-                step.has_jumped_on_failure = False
-            elif isinstance(step, ParallelFlowStep):
-                # Reset flags for all steps in parallel flow
-                for parallel_step in step.steps:
-                    if isinstance(parallel_step, FlowStep):
-                        parallel_step.has_jumped_on_failure = False
-            elif isinstance(step, IndependentFlow):
-                # Reset flags for all steps in independent flow
-                for independent_step in step.steps:
-                    if isinstance(independent_step, FlowStep):
-                        independent_step.has_jumped_on_failure = False
-                    elif isinstance(independent_step, ParallelFlowStep):
-                        for parallel_step in independent_step.steps:
-                            if isinstance(parallel_step, FlowStep):
-                                parallel_step.has_jumped_on_failure = False
+            for flow_step in _iter_flow_steps(steps[i]):
+                flow_step.has_jumped_on_failure = False
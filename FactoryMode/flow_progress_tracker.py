@@ -193,13 +193,22 @@ import logging
 import threading
 import time
 import uuid
-from dataclasses import asdict, dataclass, field
+from dataclasses import MISSING, dataclass, field, fields, replace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from FactoryMode.flow_types import _DATACLASS_SLOTS, DeviceType, FlowStep, FrozenParameters
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _format_timestamp(timestamp: float) -> str:
+    """ISO-format a time.time() value; flow start/end times are re-formatted on every JSON write."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StepExecution:
     """
     Comprehensive execution record for a single factory flow step.
@@ -239,6 +248,7 @@ class StepExecution:
     Wall-clock timing details for performance analysis:
     - `completed_at`: Unix timestamp when step finished (success or failure)
     - `duration`: Total execution time (completed_at - started_at)
+    - `started_at_ns`: Monotonic start used to measure `duration` (not part of `to_dict()`)
 
     ### **Execution Status and Results**
     Current state and final outcome of step execution:
@@ -265,6 +275,7 @@ class StepExecution:
     - `error_messages`: All ERROR-level log messages captured during step execution
     - `error_handler_executed`: Name of error handler that was called (if any)
     - `error_handler_result`: Boolean result of error handler execution
+    - `error_message`: Final failure message given on completion (not part of `to_dict()`)
 
     ### **Execution Context**
     Additional context and parameter information:
@@ -350,7 +361,7 @@ class StepExecution:
 
     ## Performance Considerations
 
-    - **Memory Efficient**: Uses dataclass field defaults to minimize memory usage
+    - **Memory Efficient**: Uses __slots__ (Python 3.10+) and dataclass field defaults
     - **Lazy Collections**: Lists and dictionaries created only when needed via field factories
     - **UUID Generation**: Execution IDs generated lazily to avoid unnecessary overhead
     - **JSON Optimized**: to_dict() method optimized for frequent serialization
@@ -388,6 +399,8 @@ class StepExecution:
     # Timing information
     completed_at: Optional[float] = None  # time.time() when step completed/failed
     duration: float = 0.0  # completed_at - started_at
+    # time.monotonic_ns() at start; duration is measured from it so wall-clock jumps do not skew it
+    started_at_ns: Optional[int] = field(default=None, repr=False, compare=False)
 
     # Execution details
     status: str = "running"  # "running", "completed", "failed", "jumped", "skipped"
@@ -409,6 +422,7 @@ class StepExecution:
     error_messages: List[str] = field(default_factory=list)  # All ERROR messages from this step
     error_handler_executed: Optional[str] = None  # Name of error handler if executed
     error_handler_result: Optional[bool] = None  # Result of error handler execution
+    error_message: Optional[str] = None  # Final failure message passed to complete_step_execution
 
     # Additional context
     parameters: Dict[str, Any] = field(default_factory=dict)  # Step parameters used
@@ -453,43 +467,85 @@ class StepExecution:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StepExecution":
         """Create StepExecution from dictionary (for JSON deserialization)."""
-        return cls(
-            step_name=data["step_name"],
-            step_operation=data["step_operation"],
-            device_type=data["device_type"],
-            device_id=data["device_id"],
-            step_index=data["step_index"],
-            retry_count=data.get("retry_count", 3),
-            timeout_seconds=data.get("timeout_seconds"),
-            wait_after_seconds=data.get("wait_after_seconds", 0),
-            wait_between_retries_seconds=data.get("wait_between_retries_seconds", 0),
-            execute_on_error=data.get("execute_on_error"),
-            execute_optional_flow=data.get("execute_optional_flow"),
-            jump_on_success=data.get("jump_on_success"),
-            jump_on_failure=data.get("jump_on_failure"),
-            tag=data.get("tag"),
-            started_at=data["started_at"],
-            flow_name=data["flow_name"],
-            completed_at=data.get("completed_at"),
-            duration=data.get("duration", 0.0),
-            status=data.get("status", "running"),
-            final_result=data.get("final_result", False),
-            retry_attempts=data.get("retry_attempts", 0),
-            retry_durations=data.get("retry_durations", []),
-            jump_taken=data.get("jump_taken"),
-            jump_target=data.get("jump_target"),
-            optional_flows_triggered=data.get("optional_flows_triggered", []),
-            optional_flow_results=data.get("optional_flow_results", {}),
-            error_messages=data.get("error_messages", []),
-            error_handler_executed=data.get("error_handler_executed"),
-            error_handler_result=data.get("error_handler_result"),
-            parameters=data.get("parameters", {}),
-            context_info=data.get("context_info", {}),
-            execution_id=data.get("execution_id", str(uuid.uuid4())),
-        )
+        kwargs = {**_STEP_DEFAULTS, **data}
+        # Factories only run for missing keys, so a stored execution_id never costs a uuid4()
+        for name, factory in _STEP_DEFAULT_FACTORIES.items():
+            if name not in kwargs:
+                kwargs[name] = factory()
+        if kwargs.keys() != _STEP_FIELD_NAMES:
+            # Drop unknown keys; a missing required field raises KeyError
+            kwargs = {name: kwargs[name] for name in _STEP_FIELD_NAMES}
+        return cls(**kwargs)
+
+
+# Defaults applied by StepExecution.from_dict for keys missing from the input, built once from the
+# dataclass fields so they cannot drift from the declared defaults
+_STEP_DEFAULTS: Dict[str, Any] = {f.name: f.default for f in fields(StepExecution) if f.default is not MISSING}
+_STEP_DEFAULT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    f.name: f.default_factory for f in fields(StepExecution) if f.default_factory is not MISSING
+}
+_STEP_FIELD_NAMES = frozenset(f.name for f in fields(StepExecution))
+
+
+# Shared parameters record for steps without parameters
+_NO_PARAMETERS = FrozenParameters()
+
+# Enum .value goes through a descriptor on every access; members map to their strings once here
+_DEVICE_TYPE_NAMES: Dict[DeviceType, str] = {device_type: device_type.value for device_type in DeviceType}
+
+
+def _device_type_name(device_type: Any) -> str:
+    """Return the string form of a step's device type (DeviceType enum or plain value)."""
+    try:
+        name = _DEVICE_TYPE_NAMES.get(device_type)
+    except TypeError:  # unhashable value
+        name = None
+    if name is not None:
+        return name
+    return device_type.value if hasattr(device_type, "value") else str(device_type)
+
 
+def _extract_step_fields(step: Any, step_index: int) -> Dict[str, Any]:
+    """
+    Collect the step configuration recorded on a StepExecution.
+
+    FlowStep always defines every field, so its attributes are read directly; other step-like
+    objects fall back to getattr with the same defaults used for missing attributes.
+    """
+    if type(step) is FlowStep:
+        return {
+            "step_name": step.name or step.operation,
+            "step_operation": step.operation,
+            "device_type": _device_type_name(step.device_type),
+            "device_id": step.device_id,
+            "retry_count": step.retry_count,
+            "timeout_seconds": step.timeout_seconds,
+            "wait_after_seconds": step.wait_after_seconds,
+            "wait_between_retries_seconds": step.wait_between_retries_seconds,
+            "execute_on_error": step.execute_on_error,
+            "execute_optional_flow": step.execute_optional_flow,
+            "jump_on_success": step.jump_on_success,
+            "jump_on_failure": step.jump_on_failure,
+            "tag": step.tag,
+        }
+    return {
+        "step_name": getattr(step, "name", None) or getattr(step, "operation", f"Step {step_index+1}"),
+        "step_operation": getattr(step, "operation", "unknown"),
+        "device_type": _device_type_name(getattr(step, "device_type", "unknown")),
+        "device_id": getattr(step, "device_id", "unknown"),
+        "retry_count": getattr(step, "retry_count", 3),
+        "timeout_seconds": getattr(step, "timeout_seconds", None),
+        "wait_after_seconds": getattr(step, "wait_after_seconds", 0),
+        "wait_between_retries_seconds": getattr(step, "wait_between_retries_seconds", 0),
+        "execute_on_error": getattr(step, "execute_on_error", None),
+        "execute_optional_flow": getattr(step, "execute_optional_flow", None),
+        "jump_on_success": getattr(step, "jump_on_success", None),
+        "jump_on_failure": getattr(step, "jump_on_failure", None),
+        "tag": getattr(step, "tag", None),
+    }
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class OptionalFlowExecution:
     """Represents a single execution of an optional flow."""
 
@@ -538,7 +594,7 @@ class OptionalFlowExecution:
         return base_name
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FlowInfo:
     """
     Flow-level aggregation and statistics container with hierarchical optional flow support.
@@ -691,7 +747,7 @@ class FlowInfo:
 
     The calculation ensures:
     - **Accuracy**: Statistics always reflect current state of steps_executed
-    - **Performance**: O(n) calculation over step list, cached until next update
+    - **Performance**: O(1) update per completed step, full O(n) recalculation only when needed
     - **Thread Safety**: All calculations performed under FlowProgressTracker lock
 
     ## Thread Safety
@@ -703,7 +759,7 @@ class FlowInfo:
     ## Performance Characteristics
 
     - **Memory Efficient**: Uses field factories for lazy collection initialization
-    - **Calculation Overhead**: O(n) over steps_executed for statistics calculation
+    - **Calculation Overhead**: O(1) per completed step; O(n) only after outside changes to steps_executed
     - **Optional Flow Scalability**: Supports deep nesting with minimal overhead
     - **JSON Serialization**: Optimized for frequent progress file updates
 
@@ -784,7 +840,7 @@ class FlowProgressTracker:
     - **GUI Integration**: Thread-safe Rich Live display updates
 
     ### **Automatic JSON Persistence**
-    - **Real-Time Sync**: JSON file updated on every significant progress change
+    - **Real-Time Sync**: JSON file updated immediately on flow state changes and within 100 ms of step updates
     - **Atomic Writes**: File operations protected to prevent corruption
     - **Hierarchical Structure**: Optional flows nested under parent flows
     - **Performance Optimized**: Incremental updates to minimize I/O blocking
@@ -1093,6 +1149,11 @@ class FlowProgressTracker:
         ErrorCollectorHandler: Error message collection integration
     """
 
+    # Maximum delay before step-level progress updates are written to the JSON file
+    JSON_FLUSH_INTERVAL_SECONDS = 0.1
+    # Unchanged progress is still rewritten after this long so the file timestamp keeps moving
+    JSON_HEARTBEAT_INTERVAL_SECONDS = 5.0
+
     def __init__(self, json_file_path: Path, output_manager=None):
         """
         Initialize the progress tracker.
@@ -1104,6 +1165,8 @@ class FlowProgressTracker:
         self.json_file_path = json_file_path
         self.flows: Dict[str, FlowInfo] = {}
         self._lock = threading.RLock()  # Reentrant lock for nested calls
+        # Most recently looked up (flow name, flow info), read without taking the lock
+        self._last_flow_info: Optional[Tuple[str, FlowInfo]] = None
         self.logger = logging.getLogger(__name__)
 
         # Output manager for callbacks
@@ -1121,6 +1184,19 @@ class FlowProgressTracker:
         self._active_step_executions: Dict[str, StepExecution] = {}  # execution_id -> StepExecution
         self._step_execution_lock = threading.RLock()
 
+        # Executed step lookup per flow name: (steps_executed list, steps indexed, execution_id -> position)
+        self._step_positions: Dict[str, Tuple[List[StepExecution], int, Dict[str, int]]] = {}
+
+        # Running statistics state per flow name: (flow, steps folded in, StepExecutions counted, max retries)
+        self._flow_statistics_state: Dict[str, Tuple[FlowInfo, int, int, int]] = {}
+
+        # Deferred JSON writes for step-level updates, coalesced into one write per interval
+        self._json_flush_timer: Optional[threading.Timer] = None
+        self._json_flush_lock = threading.Lock()
+        # Serialized "flows" payload of the last successful write, used to skip unchanged rewrites
+        self._last_written_flows_json: Optional[str] = None
+        self._last_json_write_monotonic = 0.0
+
         # Ensure directory exists
         self.json_file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -1175,37 +1251,28 @@ class FlowProgressTracker:
         Returns:
             str: Unique execution ID for tracking this step execution
         """
-        with self._step_execution_lock:
-            # Create StepExecution object
-            step_execution = StepExecution(
-                step_name=(getattr(step, "name", None) or getattr(step, "operation", f"Step {step_index+1}")),
-                step_operation=getattr(step, "operation", "unknown"),
-                device_type=(
-                    getattr(step, "device_type", "unknown").value
-                    if hasattr(getattr(step, "device_type", None), "value")
-                    else str(getattr(step, "device_type", "unknown"))
-                ),
-                device_id=getattr(step, "device_id", "unknown"),
-                step_index=step_index,
-                started_at=time.time(),
-                flow_name=flow_name,
-                retry_count=getattr(step, "retry_count", 3),
-                timeout_seconds=getattr(step, "timeout_seconds", None),
-                wait_after_seconds=getattr(step, "wait_after_seconds", 0),
-                wait_between_retries_seconds=getattr(step, "wait_between_retries_seconds", 0),
-                execute_on_error=getattr(step, "execute_on_error", None),
-                execute_optional_flow=getattr(step, "execute_optional_flow", None),
-                jump_on_success=getattr(step, "jump_on_success", None),
-                jump_on_failure=getattr(step, "jump_on_failure", None),
-                tag=getattr(step, "tag", None),
-                parameters=(getattr(step, "parameters", {}).copy() if getattr(step, "parameters", None) else {}),
-            )
+        # Read-only parameters loaded from YAML can be shared; anything else is copied so
+        # later edits to the step do not rewrite the recorded execution
+        parameters = getattr(step, "parameters", None)
+        if not isinstance(parameters, FrozenParameters):
+            parameters = parameters.copy() if parameters else _NO_PARAMETERS
+
+        # Create StepExecution object outside the lock; only the registry insert is shared state
+        step_execution = StepExecution(
+            step_index=step_index,
+            started_at=time.time(),
+            started_at_ns=time.monotonic_ns(),
+            flow_name=flow_name,
+            parameters=parameters,
+            **_extract_step_fields(step, step_index),
+        )
 
-            # Store active execution
-            execution_id = step_execution.execution_id
+        # Store active execution
+        execution_id = step_execution.execution_id
+        with self._step_execution_lock:
             self._active_step_executions[execution_id] = step_execution
 
-            return execution_id
+        return execution_id
 
     def complete_step_execution(self, execution_id: str, result: bool, error_message: str = None) -> None:
         """
@@ -1217,12 +1284,14 @@ class FlowProgressTracker:
             error_message: Error message if step failed
         """
         with self._step_execution_lock:
-            if execution_id in self._active_step_executions:
-                step_execution = self._active_step_executions[execution_id]
-
+            step_execution = self._active_step_executions.get(execution_id)
+            if step_execution is not None:
                 # Complete the execution
                 step_execution.completed_at = time.time()
-                step_execution.duration = step_execution.completed_at - step_execution.started_at
+                if step_execution.started_at_ns is not None:
+                    step_execution.duration = (time.monotonic_ns() - step_execution.started_at_ns) / 1e9
+                else:
+                    step_execution.duration = step_execution.completed_at - step_execution.started_at
                 step_execution.final_result = result
                 step_execution.status = "completed" if result else "failed"
 
@@ -1234,23 +1303,27 @@ class FlowProgressTracker:
                     flow_name = step_execution.flow_name
                     if flow_name in self.flows:
                         self.flows[flow_name].steps_executed.append(step_execution)
-                        self._calculate_flow_statistics(flow_name)
-
-                # Notify output manager of step completion with full step data
-                if self.output_manager:
-                    self.output_manager.on_step_completed(
-                        step_execution.flow_name,
-                        step_execution.step_name,
-                        result,
-                        step_execution.duration,
-                        step_execution.to_dict(),
-                    )
+                        self._add_step_to_flow_statistics(flow_name, step_execution)
 
                 # Remove from active executions
                 del self._active_step_executions[execution_id]
 
-                # Write JSON with updated data
-                self._write_json()
+        if step_execution is None:
+            return
+
+        # Notify output manager of step completion with full step data; console output runs
+        # outside the lock so other threads can keep starting and completing steps
+        if self.output_manager:
+            self.output_manager.on_step_completed(
+                step_execution.flow_name,
+                step_execution.step_name,
+                result,
+                step_execution.duration,
+                step_execution.to_dict(),
+            )
+
+        # Write JSON with updated data (batched with other step updates)
+        self._schedule_json_write()
 
     def update_step_execution(
         self,
@@ -1350,21 +1423,52 @@ class FlowProgressTracker:
     def is_step_execution_complete(self, execution_id: str) -> bool:
         """Check if a step execution is marked as complete."""
         # Search all flows for the execution_id
-        for flow in self.flows.values():
-            for step in flow.steps_executed:
-                if step.execution_id == execution_id:
-                    return step.status in ["completed", "failed"]
+        for flow_name, flow in list(self.flows.items()):
+            step = self._find_executed_step(flow_name, flow, execution_id)
+            if step is not None:
+                return step.status in ["completed", "failed"]
         return False
 
     def find_step_execution(self, flow_name: str, execution_id: str) -> Optional[StepExecution]:
         """Find a step execution by flow name and execution ID."""
-        if flow_name in self.flows:
-            flow = self.flows[flow_name]
-            for step in flow.steps_executed:
-                if step.execution_id == execution_id:
-                    return step
+        flow = self.flows.get(flow_name)
+        if flow is not None:
+            return self._find_executed_step(flow_name, flow, execution_id)
         return None
 
+    def _find_executed_step(self, flow_name: str, flow: FlowInfo, execution_id: str) -> Optional[StepExecution]:
+        """
+        Look up a step in flow.steps_executed through a per-flow execution_id -> position index.
+
+        Steps are appended to steps_executed, so the index only has to catch up on the new tail
+        and repeated lookups stay O(1) as the flow grows. It is rebuilt when the flow was re-added,
+        its step list replaced or shortened, and a position that no longer holds the step falls
+        back to a full scan.
+        """
+        steps = flow.steps_executed
+        with self._lock:
+            entry = self._step_positions.get(flow_name)
+            if entry is None or entry[0] is not steps or entry[1] > len(steps):
+                entry = (steps, 0, {})
+            _, indexed, positions = entry
+            if indexed < len(steps):
+                for position in range(indexed, len(steps)):
+                    # Keep the first occurrence, as the linear search did
+                    positions.setdefault(steps[position].execution_id, position)
+                entry = (steps, len(steps), positions)
+            self._step_positions[flow_name] = entry
+
+            position = positions.get(execution_id)
+            if position is None:
+                return None
+            step = steps[position]
+            if step.execution_id == execution_id:
+                return step
+
+            # The list was edited in place; drop the stale index and search directly
+            del self._step_positions[flow_name]
+            return next((step for step in steps if step.execution_id == execution_id), None)
+
     def _calculate_flow_statistics(self, flow_name: str) -> None:
         """Recalculate and update summary statistics from StepExecution objects."""
         with self._lock:
@@ -1403,6 +1507,45 @@ class FlowProgressTracker:
                     )
                     flow.step_with_most_retries = step_with_most_retries.step_name
 
+                self._flow_statistics_state[flow_name] = (flow, len(steps), len(step_executions), max_retries)
+
+    def _add_step_to_flow_statistics(self, flow_name: str, step: StepExecution) -> None:
+        """
+        Fold a StepExecution just appended to steps_executed into the flow statistics.
+
+        Updates the running totals in O(1) instead of rescanning every step. Falls back to
+        _calculate_flow_statistics when steps_executed was changed outside the tracker since
+        the last update, or the flow was re-added.
+        """
+        with self._lock:
+            flow = self.flows[flow_name]
+            state = self._flow_statistics_state.get(flow_name)
+            if state is None or state[0] is not flow or state[1] != len(flow.steps_executed) - 1:
+                self._calculate_flow_statistics(flow_name)
+                return
+
+            _, steps_seen, step_count, max_retries = state
+            step_count += 1
+
+            flow.total_step_duration += step.duration
+            flow.total_retry_attempts += step.retry_attempts
+            flow.total_optional_flows_triggered += len(step.optional_flows_triggered)
+            if step.jump_taken:
+                flow.total_jumps_taken += 1
+            if not step.final_result:
+                flow.failed_steps_count += 1
+
+            flow.average_step_duration = flow.total_step_duration / step_count
+            if step.duration > flow.longest_step_duration:
+                flow.longest_step_duration = step.duration
+
+            # Earliest step keeps the title on ties, matching the full recalculation
+            if step.retry_attempts > max_retries:
+                max_retries = step.retry_attempts
+                flow.step_with_most_retries = step.step_name
+
+            self._flow_statistics_state[flow_name] = (flow, steps_seen + 1, step_count, max_retries)
+
     # --- Unified Progress Tracking Methods ---
 
     def _auto_update_gui(self, *, flow_name: str, step_name: str, status: str, step_number: int):
@@ -1473,6 +1616,7 @@ class FlowProgressTracker:
                 parent_flow_name=parent_flow_name,
                 triggered_by_step=triggered_by_step,
             )
+            self._last_flow_info = None
             self._write_json()
 
     def set_flow_completed(self, flow_name: str) -> None:
@@ -1583,7 +1727,7 @@ class FlowProgressTracker:
                         step_number=flow.current_step_index,
                     )
 
-                self._write_json()
+                self._schedule_json_write()
 
     def set_flow_error(self, flow_name: str, error_message: str) -> None:
         """Mark a flow as having an error."""
@@ -1607,13 +1751,30 @@ class FlowProgressTracker:
 
     def get_flow_info(self, flow_name: str) -> Optional[FlowInfo]:
         """Get information about a specific flow."""
+        # Repeated lookups of the same flow skip the lock; the tuple is replaced atomically
+        last = self._last_flow_info
+        if last is not None and last[0] == flow_name:
+            return last[1]
+
         with self._lock:
-            return self.flows.get(flow_name)
+            flow = self.flows.get(flow_name)
+            if flow is not None:
+                self._last_flow_info = (flow_name, flow)
+            return flow
 
     def get_all_flows(self) -> Dict[str, FlowInfo]:
         """Get information about all flows."""
+        # Shallow copies: the containers are new, the StepExecution records are shared
         with self._lock:
-            return {name: FlowInfo(**asdict(flow)) for name, flow in self.flows.items()}
+            return {
+                name: replace(
+                    flow,
+                    optional_flows=dict(flow.optional_flows),
+                    steps_executed=list(flow.steps_executed),
+                    error_messages=list(flow.error_messages),
+                )
+                for name, flow in self.flows.items()
+            }
 
     def get_flow_status_dict(self) -> Dict[str, Dict[str, str]]:
         """Get flow status in the old dictionary format for compatibility."""
@@ -1631,6 +1792,9 @@ class FlowProgressTracker:
         """Clear all flow data."""
         with self._lock:
             self.flows.clear()
+            self._flow_statistics_state.clear()
+            self._step_positions.clear()
+            self._last_flow_info = None
             self._write_json()
 
     def _get_flow_summary_dict(self, flow_name: str) -> Dict[str, Any]:
@@ -1670,21 +1834,21 @@ class FlowProgressTracker:
         with self._lock:
             if flow_name in self.flows:
                 self.flows[flow_name].retries_executed += retry_count
-                self._write_json()
+                self._schedule_json_write()
 
     def increment_jump_on_success(self, flow_name: str) -> None:
         """Increment successful jump counter for flow."""
         with self._lock:
             if flow_name in self.flows:
                 self.flows[flow_name].jump_on_success_executed += 1
-                self._write_json()
+                self._schedule_json_write()
 
     def increment_jump_on_failure(self, flow_name: str) -> None:
         """Increment failure jump counter for flow."""
         with self._lock:
             if flow_name in self.flows:
                 self.flows[flow_name].jump_on_failure_executed += 1
-                self._write_json()
+                self._schedule_json_write()
 
     # --- Timing Methods ---
 
@@ -1708,10 +1872,52 @@ class FlowProgressTracker:
                     return flow.total_testtime
         return 0.0
 
-    def _write_json(self) -> None:
-        """Write the current progress data to JSON file."""
+    def _schedule_json_write(self) -> None:
+        """
+        Request a JSON write for a step-level update without blocking the caller.
+
+        Updates arriving within JSON_FLUSH_INTERVAL_SECONDS of each other share a single write of the
+        latest snapshot. Flow-level transitions still write immediately via _write_json, which also
+        absorbs any pending deferred write.
+        """
+        with self._json_flush_lock:
+            if self._json_flush_timer is not None:
+                return
+            timer = threading.Timer(self.JSON_FLUSH_INTERVAL_SECONDS, self._flush_scheduled_json)
+            timer.daemon = True
+            self._json_flush_timer = timer
+        timer.start()
+
+    def _flush_scheduled_json(self) -> None:
+        """Timer callback writing the snapshot requested by _schedule_json_write."""
+        with self._lock:
+            self._write_json()
+
+    def flush(self) -> None:
+        """
+        Write the latest progress snapshot to the JSON file immediately, including any pending update.
+
+        Writes during execution are compact single-line JSON; this snapshot is indented, so the file
+        left behind when the orchestrator closes is readable and diffable.
+        """
+        with self._lock:
+            self._write_json(indent=True)
+
+    def _write_json(self, indent: bool = False) -> None:
+        """
+        Write the current progress data to JSON file.
+
+        Args:
+            indent (bool): Write indented JSON instead of compact single-line JSON
+        """
+        # This write includes every update a deferred write was scheduled for
+        with self._json_flush_lock:
+            timer, self._json_flush_timer = self._json_flush_timer, None
+        if timer is not None:
+            timer.cancel()
+
         try:
-            json_data = {"timestamp": datetime.now().isoformat(), "flows": {}}
+            flows_data: Dict[str, Any] = {}
 
             # Separate main flows and optional flows
             main_flows = {}
@@ -1782,23 +1988,44 @@ class FlowProgressTracker:
 
                         # Add timing info if available
                         if opt_flow.started_at:
-                            optional_flow_data["started_at"] = datetime.fromtimestamp(opt_flow.started_at).isoformat()
+                            optional_flow_data["started_at"] = _format_timestamp(opt_flow.started_at)
                         if opt_flow.completed_at:
-                            optional_flow_data["completed_at"] = datetime.fromtimestamp(
-                                opt_flow.completed_at
-                            ).isoformat()
+                            optional_flow_data["completed_at"] = _format_timestamp(opt_flow.completed_at)
 
                         flow_data["optional_flows"][opt_flow_name] = optional_flow_data
 
-                json_data["flows"][flow_name] = flow_data
+                flows_data[flow_name] = flow_data
+
+            # Compact one-shot dumps runs entirely in the C encoder; indent or json.dump
+            # to a stream fall back to the pure-Python encoder
+            flows_serialized = json.dumps(flows_data, separators=(",", ":"))
+
+            # Nothing changed since a recent write (e.g. a flush with no new updates); skip the I/O
+            now = time.monotonic()
+            if (
+                not indent
+                and flows_serialized == self._last_written_flows_json
+                and now - self._last_json_write_monotonic < self.JSON_HEARTBEAT_INTERVAL_SECONDS
+                and self.json_file_path.exists()
+            ):
+                return
+
+            if indent:
+                serialized = json.dumps({"timestamp": datetime.now().isoformat(), "flows": flows_data}, indent=2)
+            else:
+                # Splice in the write timestamp instead of encoding the flows a second time
+                timestamp = json.dumps(datetime.now().isoformat())
+                serialized = f'{{"timestamp":{timestamp},"flows":{flows_serialized}}}'
 
             # Write atomically by writing to temp file then renaming
             temp_path = self.json_file_path.with_suffix(".tmp")
             with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(json_data, f, indent=2)
+                f.write(serialized)
 
             # Atomic rename
             temp_path.replace(self.json_file_path)
+            self._last_written_flows_json = flows_serialized
+            self._last_json_write_monotonic = now
 
         except Exception as e:
             self.logger.warning(f"Failed to write progress JSON file: {str(e)}")
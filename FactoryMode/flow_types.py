@@ -20,10 +20,38 @@ This module contains the core data structures used to define factory flows,
 including device types, flow steps, and output modes.
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
+# Flow steps are created in large numbers for long flows; __slots__ keeps them compact and makes
+# attribute access a slot lookup. dataclass(slots=True) is only available on Python 3.10+.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class FrozenParameters(dict):
+    """
+    Read-only step parameter mapping.
+
+    Identical parameter sets are shared between steps when a flow is loaded, so in-place edits
+    are rejected to keep one step from changing another. It stays a dict subclass so existing
+    callers (``**parameters``, ``json.dump``, ``.copy()``) keep working; ``.copy()`` returns a
+    plain, mutable dict.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Step parameters are read-only")
+
+    __setitem__ = __delitem__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+    __ior__ = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
 
 class DeviceType(Enum):
     """Types of devices supported by the factory flow."""
@@ -50,9 +78,15 @@ class OutputMode(Enum):
     JSON = "json"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FlowStep:
-    """Represents a single step in the factory flow."""
+    """
+    Represents a single step in the factory flow.
+
+    Steps loaded from YAML share one read-only FrozenParameters mapping per distinct set of
+    hashable parameter values, so changing ``parameters`` in place raises TypeError. To change
+    a step's parameters, assign a new dict (e.g. ``step.parameters = {**step.parameters, "key": value}``).
+    """
 
     device_type: DeviceType
     device_id: str
@@ -75,7 +109,7 @@ class FlowStep:
     current_flow_name: Optional[str] = None  # Current flow name for progress tracking
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ParallelFlowStep:
     """Represents a group of steps to be executed in parallel."""
 
@@ -85,7 +119,7 @@ class ParallelFlowStep:
     wait_after_seconds: int = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class IndependentFlow:
     """Represents a self-contained flow that can run independently."""
 
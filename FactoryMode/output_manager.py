@@ -53,6 +53,7 @@ import json
 import logging
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
@@ -91,11 +92,14 @@ _logging_state = _LoggingState()
 # Thread-local storage for error messages
 _thread_local = threading.local()
 
+# Most recent ERROR messages kept per collecting thread; older ones are dropped
+MAX_COLLECTED_ERRORS = 64
+
 
 def _get_thread_errors():
-    """Get the error list for the current thread."""
+    """Get the bounded error buffer for the current thread."""
     if not hasattr(_thread_local, "error_messages"):
-        _thread_local.error_messages = []
+        _thread_local.error_messages = deque(maxlen=MAX_COLLECTED_ERRORS)
     return _thread_local.error_messages
 
 
@@ -132,12 +136,12 @@ def start_collecting_errors():
 def stop_collecting_errors():
     """Stop collecting ERROR messages for the current thread and return collected errors."""
     _set_thread_collecting(False)
-    return _get_thread_errors().copy()
+    return list(_get_thread_errors())
 
 
 def get_collected_errors():
     """Get currently collected error messages for the current thread."""
-    return _get_thread_errors().copy()
+    return list(_get_thread_errors())
 
 
 class ErrorCollectorHandler(logging.Handler):